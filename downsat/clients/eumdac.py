@@ -237,10 +237,8 @@ class EumdacCollection(abc.DataSource[str, BytesIO]):
         elif len(products) > 1:
             raise RuntimeError(f"found duplicate records for {item=}")
 
-        buffer = BytesIO()
         with products[0].open() as stream:
-            buffer.write(stream.read())
-            buffer.seek(0)
+            buffer = BytesIO(stream.read())
         setmeta(buffer, name=item)
 
         return buffer
@@ -207,7 +207,7 @@ class _FileDataset(
     def _save(self, key: str, value: Any) -> MetaPathOrMetaPathCollection:
         """Save value to a file.
 
-        Uses singledispatch function `to_filesystem` to save the value to a file.
+        Uses generic function `to_filesystem` to save the value to a file.
 
         :param filename: Filename.
         :param value: Value to be saved.
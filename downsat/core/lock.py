@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from typing import Any, Callable
 from abc import ABC, abstractmethod
 from pathlib import Path
+from types import TracebackType
 
 from attrs import evolve, field, frozen
 import diskcache
@@ -21,10 +23,29 @@ class LockBase(protocols.Lock[types.LockType_co], ABC):
     lock_path: Path = field(converter=Path)
     lock_key: str = field(default="__default_lock__", converter=str)
     lock: types.LockType_co = field(init=False)
+    # bound methods of the lock, looked up only once for `__enter__` and `__exit__`
+    _enter: Callable[[], Any] = field(init=False, repr=False, eq=False)
+    _exit: Callable[..., Any] = field(init=False, repr=False, eq=False)
 
     def __attrs_post_init__(self) -> None:
         """Initialize lock."""
-        object.__setattr__(self, "lock", self._create_lock())
+        lock = self._create_lock()
+        object.__setattr__(self, "lock", lock)
+        object.__setattr__(self, "_enter", lock.__enter__)  # type: ignore[attr-defined]
+        object.__setattr__(self, "_exit", lock.__exit__)  # type: ignore[attr-defined]
+
+    def __enter__(self) -> None:
+        """Use lock as context manager."""
+        return self._enter()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Use lock as context manager."""
+        return self._exit(exc_type, exc_value, traceback)
 
     def __call__(self, lock_key: str) -> LockBase[types.LockType_co]:
         """Return new lock with different lock_key."""
@@ -1,15 +1,16 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Callable, Dict, Generic, Type, _ProtocolMeta, overload
-from abc import ABC, ABCMeta, abstractmethod, abstractproperty
+from abc import ABCMeta, abstractmethod, abstractproperty
 from functools import partial
 import logging
+from operator import attrgetter
 
 from attrs import field, frozen
 
 from downsat.etl import class_transforms, protocols, types
 from downsat.etl.class_utils import _build_constant_property, _check_fields_compatibility, _extract_fields
-from downsat.etl.context import RunContext
+from downsat.etl.context import RUN_CONTEXT_DUNDER, RunContext
 
 
 if TYPE_CHECKING:
@@ -82,12 +83,7 @@ class DataSourceMeta(_ProtocolMeta, ABCMeta):
             raise TypeError(f"Unkonwn type {type(transform)} for >> operator.)")
 
 
-class DataSource(
-    ABC,
-    protocols.DataSource[types.KeyType_contra, types.OutputType_co],
-    Generic[types.KeyType_contra, types.OutputType_co],
-    metaclass=DataSourceMeta,
-):
+class DataSource(protocols.DataSource[types.KeyType_contra, types.OutputType_co], metaclass=DataSourceMeta):
     """DataSource abstract base class. Implements DataSource protocol."""
 
     @abstractmethod
@@ -101,10 +97,7 @@ class DataSource(
 
 
 class MultiKeyDataSource(
-    ABC,
-    protocols.MultiKeyDataSource[types.KeyType_contra, types.OutputType_co],
-    Generic[types.KeyType_contra, types.OutputType_co],
-    metaclass=DataSourceMeta,
+    protocols.MultiKeyDataSource[types.KeyType_contra, types.OutputType_co], metaclass=DataSourceMeta
 ):
     """Abstract base class of a datasource accepting multiple keys. Implements MultiKeyDataSource."""
 
@@ -231,9 +224,7 @@ class PipelineTransformMeta(_ProtocolMeta, ABCMeta):
 
 
 class PipelineTransform(
-    ABC,
-    Generic[types.InputType_contra, types.OutputType_co],
-    metaclass=PipelineTransformMeta,
+    Generic[types.InputType_contra, types.OutputType_co], metaclass=PipelineTransformMeta
 ):
     @abstractmethod
     def __call__(self, inp: types.InputType_contra) -> types.OutputType_co:
@@ -246,22 +237,40 @@ class _InstantiateClassMixin:
     # TODO: test funcionality
     @overload
     def _maybe_instantiate(
-        self, obj: Type[types.Instance], kwarg_names: list[str] | None = None
+        self,
+        obj: Type[types.Instance],
+        kwarg_names: tuple[str, ...],
+        kwarg_getters: tuple[Callable[[Any], Any], ...],
     ) -> types.Instance:
         ...
 
     @overload
-    def _maybe_instantiate(self, obj: types.Instance, kwarg_names: list[str] | None = None) -> types.Instance:
+    def _maybe_instantiate(
+        self,
+        obj: types.Instance,
+        kwarg_names: tuple[str, ...],
+        kwarg_getters: tuple[Callable[[Any], Any], ...],
+    ) -> types.Instance:
         ...
 
     def _maybe_instantiate(
-        self, obj: types.Instance | Type[types.Instance], kwarg_names: list[str] | None = None
+        self,
+        obj: types.Instance | Type[types.Instance],
+        kwarg_names: tuple[str, ...],
+        kwarg_getters: tuple[Callable[[Any], Any], ...],
     ) -> types.Instance:
+        """Instantiate obj if it is a class or partial, return it unchanged otherwise.
+
+        :param obj: Class, partial or already instantiated object.
+        :param kwarg_names: Names of init arguments passed to obj.
+        :param kwarg_getters: Getters of init argument values from self, precomputed by `_concretize`
+            in the same order as kwarg_names.
+        :returns: Instance of obj.
+        """
         if obj is None:
             return None
         elif isinstance(obj, (type, partial)):
-            kwarg_names = kwarg_names or []
-            kwargs = {name: getattr(self, name) for name in kwarg_names}
+            kwargs = dict(zip(kwarg_names, [getter(self) for getter in kwarg_getters]))
 
             # class that needs to be instantiated
             return obj(**kwargs)
@@ -285,7 +294,9 @@ class _InstantiateClassMixin:
         # instantiate
         for property_name in properties_for_initialization:
             property_instance = self._maybe_instantiate(
-                getattr(self, f"{property_name}_def"), getattr(self, f"{property_name}_kwargs")
+                getattr(self, f"{property_name}_def"),
+                getattr(self, f"{property_name}_kwargs"),
+                getattr(self, f"{property_name}_getters"),
             )
             object.__setattr__(self, f"{property_name}", property_instance)
 
@@ -296,7 +307,7 @@ class _InstantiateClassMixin:
         :param class_name: Name of the created class.
         :param base_class: Parent class implementing bussiness logic.
         :param properties: Dict of properties to be added to the class. The class will have properties
-            _{key}_def, _{key}_kwargs and _{key}
+            _{key}_def, _{key}_kwargs, _{key}_getters and _{key}
         :returns: Class that instantiates the properties during __init__ and passes them proper init arguments.
         """
 
@@ -308,7 +319,7 @@ class _InstantiateClassMixin:
         # find init arguments of all properties and make sure they are compatible
         kwargs: dict[str, dict[str, "_CountingAttr"]] = {}
         for name, obj in objects.items():
-            fields = _extract_fields(obj, properties)
+            fields = _extract_fields(obj, properties.keys())
             for other_fields in kwargs.values():
                 _check_fields_compatibility(fields, other_fields)
             kwargs[name] = fields
@@ -316,7 +327,8 @@ class _InstantiateClassMixin:
         # store infor on which input arguments go to which property during initialization
         for name, fields in kwargs.items():
             properties.update(fields)
-            properties[f"_{name}_kwargs"] = list(fields.keys())
+            properties[f"_{name}_kwargs"] = tuple(fields.keys())
+            properties[f"_{name}_getters"] = tuple(attrgetter(field_name) for field_name in fields)
 
         if class_name is None:
             # use parent class name but remove leading _ so that the names do not clash
@@ -328,6 +340,11 @@ class _InstantiateClassMixin:
                     "Please provide explicit class name via input argument class_name."
                 )
             class_name = class_name[1:]
+
+        # store run context of the class locally instead of in the global context dict
+        # Note: each call builds a new class with a new dict; the dict is not used by its subclasses and instances
+        properties[RUN_CONTEXT_DUNDER] = {}
+
         cls = type(class_name, (cls,), properties)
         return frozen(slots=False)(cls)
 
@@ -346,13 +363,21 @@ class _ModifiedInputDataSource(
         """Original datasource."""
 
     @abstractproperty
-    def _input_transform_kwargs(self) -> list[str]:
+    def _input_transform_kwargs(self) -> tuple[str, ...]:
         """Kwargs used when initializing self._input_transform_def."""
 
     @abstractproperty
-    def _datasource_kwargs(self) -> list[str]:
+    def _input_transform_getters(self) -> tuple[Callable[[Any], Any], ...]:
+        """Getters of init argument values for self._input_transform_def."""
+
+    @abstractproperty
+    def _datasource_kwargs(self) -> tuple[str, ...]:
         """Kwargs used when initializing self._datasource_def."""
 
+    @abstractproperty
+    def _datasource_getters(self) -> tuple[Callable[[Any], Any], ...]:
+        """Getters of init argument values for self._datasource_def."""
+
     _input_transform: protocols.PipelineTransform[types.InputType, types.KeyType] = field(init=False)
     _datasource: protocols.DataSource[types.KeyType, types.OutputType_co] = field(init=False)
 
@@ -402,13 +427,21 @@ class _ModifiedOutputDataSource(
         """Transform datasource outputs."""
 
     @abstractproperty
-    def _datasource_kwargs(self) -> list[str]:
+    def _datasource_kwargs(self) -> tuple[str, ...]:
         """Kwargs used when initializing self._datasource_def."""
 
     @abstractproperty
-    def _output_transform_kwargs(self) -> list[str]:
+    def _datasource_getters(self) -> tuple[Callable[[Any], Any], ...]:
+        """Getters of init argument values for self._datasource_def."""
+
+    @abstractproperty
+    def _output_transform_kwargs(self) -> tuple[str, ...]:
         """Kwargs used when initializing self._output_transform_def."""
 
+    @abstractproperty
+    def _output_transform_getters(self) -> tuple[Callable[[Any], Any], ...]:
+        """Getters of init argument values for self._output_transform_def."""
+
     _datasource: protocols.DataSource[types.KeyType_contra, types.InputType] = field(init=False)
     _output_transform: protocols.PipelineTransform[types.InputType, types.OutputType_co] = field(init=False)
 
@@ -457,13 +490,21 @@ class _ComposedTransform(
         """Second transform."""
 
     @abstractproperty
-    def _transform1_kwargs(self) -> list[str]:
+    def _transform1_kwargs(self) -> tuple[str, ...]:
         """Kwargs used when initializing self._transform1_def."""
 
     @abstractproperty
-    def _transform2_kwargs(self) -> list[str]:
+    def _transform1_getters(self) -> tuple[Callable[[Any], Any], ...]:
+        """Getters of init argument values for self._transform1_def."""
+
+    @abstractproperty
+    def _transform2_kwargs(self) -> tuple[str, ...]:
         """Kwargs used when initializing self._transform2_def."""
 
+    @abstractproperty
+    def _transform2_getters(self) -> tuple[Callable[[Any], Any], ...]:
+        """Getters of init argument values for self._transform2_def."""
+
     _transform1: protocols.PipelineTransform[types.InputType_contra, types.OutputInputType] = field(
         init=False
     )
@@ -498,9 +539,13 @@ class _QueryDataSource(
         """Original datasource."""
 
     @abstractproperty
-    def _datasource_kwargs(self) -> list[str]:
+    def _datasource_kwargs(self) -> tuple[str, ...]:
         """Kwargs used when initializing self._datasource_def."""
 
+    @abstractproperty
+    def _datasource_getters(self) -> tuple[Callable[[Any], Any], ...]:
+        """Getters of init argument values for self._datasource_def."""
+
     @property
     def _query_cache_def(
         self,
@@ -515,8 +560,12 @@ class _QueryDataSource(
         return None
 
     @property
-    def _query_cache_kwargs(self) -> list[str]:
-        return []
+    def _query_cache_kwargs(self) -> tuple[str, ...]:
+        return ()
+
+    @property
+    def _query_cache_getters(self) -> tuple[Callable[[Any], Any], ...]:
+        return ()
 
     _datasource: protocols.QueryDataSource[types.KeyType, types.OutputType_co] = field(
         init=False
@@ -587,13 +636,21 @@ class _CachedDataSource(
         """Cache datasource outputs."""
 
     @abstractproperty
-    def _datasource_kwargs(self) -> list[str]:
+    def _datasource_kwargs(self) -> tuple[str, ...]:
         """Kwargs used when initializing self._datasource_def."""
 
     @abstractproperty
-    def _cache_kwargs(self) -> list[str]:
+    def _datasource_getters(self) -> tuple[Callable[[Any], Any], ...]:
+        """Getters of init argument values for self._datasource_def."""
+
+    @abstractproperty
+    def _cache_kwargs(self) -> tuple[str, ...]:
         """Kwargs used when initializing self._cache_def."""
 
+    @abstractproperty
+    def _cache_getters(self) -> tuple[Callable[[Any], Any], ...]:
+        """Getters of init argument values for self._cache_def."""
+
     _datasource: protocols.DataSource[types.KeyType_contra, types.OutputType_co] = field(init=False)
     _cache: protocols.Dataset[types.KeyType_contra, types.InputOutputType, types.OutputType_co] = field(
         init=False
@@ -612,14 +669,22 @@ class _CachedDataSource(
         :param key: Single index or tuple of those.
         :returns: Possibly cached data from the original DataSource.
         """
-        result: types.OutputType_co | tuple[types.OutputType_co, ...]
         if isinstance(key, tuple):
-            # multiple keys
-            result = tuple(self[single_key] for single_key in key)  # type: ignore  # TODO: fix  # TODO: use map to paralelize
+            # multiple keys, nested tuples are resolved recursively
+            return tuple(
+                self[single_key] if isinstance(single_key, tuple) else self._getitem_single(single_key)  # type: ignore  # TODO: fix
+                for single_key in key
+            )  # TODO: use map to paralelize
+
+        return self._getitem_single(key)
 
-            return result
+    def _getitem_single(self, key: types.KeyType_contra) -> types.OutputType_co:
+        """Get cached data for a single key or load them from the original data source and save to cache.
 
-        # single key
+        :param key: Single index.
+        :returns: Possibly cached data from the original DataSource.
+        """
+        result: types.OutputType_co
         try:
             result = self._cache[key]
         except KeyError:
@@ -668,13 +733,21 @@ class _ReduceTransform(
         """First transform."""
 
     @abstractproperty
-    def _datasource_kwargs(self) -> list[str]:
+    def _datasource_kwargs(self) -> tuple[str, ...]:
         """Kwargs used when initializing self._datasource_def."""
 
     @abstractproperty
-    def _transform_kwargs(self) -> list[str]:
+    def _datasource_getters(self) -> tuple[Callable[[Any], Any], ...]:
+        """Getters of init argument values for self._datasource_def."""
+
+    @abstractproperty
+    def _transform_kwargs(self) -> tuple[str, ...]:
         """Kwargs used when initializing self._transform_def."""
 
+    @abstractproperty
+    def _transform_getters(self) -> tuple[Callable[[Any], Any], ...]:
+        """Getters of init argument values for self._transform_def."""
+
     _datasource: protocols.MultiKeyDataSource[types.KeyType_contra, types.InputOutputType] = field(
         init=False
     )  # TODO: require DataSource and convert to MultiKey here
@@ -4,7 +4,7 @@ from typing import Any, Callable, Type, overload
 from functools import partial
 
 from downsat.etl import abc, protocols, types
-from downsat.etl.context import RunContext
+from downsat.etl.context import RUN_CONTEXT_DUNDER, RunContext
 from downsat.etl.metaclasses import inject_class_base
 
 
@@ -129,20 +129,37 @@ def multikey_ds(
         return cls
     # TODO: if is protocols.MultiKeyDataSource, check signature (tuple->tuple)
 
+    # look up the original __getitem__ and run context getter once instead of on every call
+    single_getitem = cls.__getitem__
+    get_run_context = RunContext.from_obj
+
+    def multiple_getitem(
+        self: abc.MultiKeyDataSource[types.KeyType_contra, types.OutputType_co],
+        key: tuple[types.KeyType_contra, ...],
+    ) -> tuple[types.OutputType_co, ...]:
+        return get_run_context(self).map(partial(single_getitem, self), key)  # type: ignore
+
+    # getitem implementation for each type of key, filled lazily for key types other than tuple
+    getitem_by_key_type: dict[type, Callable[[Any, Any], Any]] = {tuple: multiple_getitem}
+
     def multikey_getitem(
         self: abc.MultiKeyDataSource[types.KeyType_contra, types.OutputType_co],
         key: types.KeyType_contra | tuple[types.KeyType_contra, ...],
     ) -> types.OutputType_co | tuple[types.OutputType_co, ...]:
+        key_type = type(key)
+        try:
+            getitem = getitem_by_key_type[key_type]
+        except KeyError:
+            # multiple keys for tuple subclasses, single key otherwise
+            getitem = multiple_getitem if isinstance(key, tuple) else single_getitem
+            getitem_by_key_type[key_type] = getitem
 
-        if isinstance(key, tuple):
-            # multiple keys
-            return RunContext.from_obj(self).map(lambda k: cls.__getitem__(self, k), key)  # type: ignore
-
-        # single key
-        return cls.__getitem__(self, key)  # type: ignore  # self is MultiKeyDataSource, but single_getitem expects DataSource
+        return getitem(self, key)
 
     # dynamically redefine the class; works better with mypy than using setattr
-    return inject_class_base(cls, abc.MultiKeyDataSource, update_dict={"__getitem__": multikey_getitem})
+    return inject_class_base(
+        cls, abc.MultiKeyDataSource, update_dict={"__getitem__": multikey_getitem, RUN_CONTEXT_DUNDER: {}}
+    )
 
 
 def transform_ds_input(
@@ -166,7 +183,6 @@ def transform_ds_input(
     Parallelizes the requests using joblib.Parallel.
     TODO: allow customisation of the parallelisation (different backend, specify num_cpu in the decorator or by a property of the object during runtime)
     """
-
     # TODO: validate input_transform_class and datasource_class
     return abc._ModifiedInputDataSource._concretize(
         {"input_transform": transform, "datasource": ds},
@@ -194,7 +210,6 @@ def transform_ds_output(
     Parallelizes the requests using joblib.Parallel.
     TODO: allow customisation of the parallelisation (different backend, specify num_cpu in the decorator or by a property of the object during runtime)
     """
-
     # TODO: validate input_transform_class and datasource_class
     return abc._ModifiedOutputDataSource._concretize({"datasource": ds, "output_transform": transform})
 
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Callable
-from collections.abc import Iterable
+from collections.abc import Set
 from functools import partial
 import inspect
 from types import MappingProxyType
+from weakref import WeakKeyDictionary
 
 import attrs
 from attrs import field
@@ -14,15 +15,25 @@ if TYPE_CHECKING:
     from attrs._make import _CountingAttr
 
 
-def _callable_signature_to_fields(obj: Callable) -> dict[str, "_CountingAttr"]:
-    """Return list of attrs fields corresponding to function arguments.
+_signature_defaults_cache: WeakKeyDictionary[Any, tuple[tuple[str, Any], ...]] = WeakKeyDictionary()
+
+
+def _callable_signature_to_defaults(obj: Callable) -> tuple[tuple[str, Any], ...]:
+    """Return names and defaults of function arguments.
+
+    The result is cached by the callable so that each class is inspected only once.
 
     :param func: Function to be analyzed. Cannot contain variadic args or kwargs
         unless the signature is func(*args, **kwargs) in which case they are ommited.
-    :returns: List of function arguments described by attrs fields.
+    :returns: Tuple of (argument name, default) pairs. Default is attrs.NOTHING for arguments without default.
     :raises ValueError: Function accepts positional-only arguments.
     :raises NotImplementedError: Function accepts **kwargs.
     """
+    try:
+        return _signature_defaults_cache[obj]
+    except (KeyError, TypeError):  # TypeError: obj cannot be weakly referenced
+        pass
+
     # inspect __init__ signature
     params: dict[int, inspect.Parameter] | MappingProxyType[str, inspect.Parameter]
     if hasattr(obj, "__init__"):
@@ -32,8 +43,12 @@ def _callable_signature_to_fields(obj: Callable) -> dict[str, "_CountingAttr"]:
         sig = inspect.signature(obj)
         params = sig.parameters
 
-    has_args = any(param.kind == param.VAR_POSITIONAL for param in params.values())
-    has_kwargs = any(param.kind == param.VAR_KEYWORD for param in params.values())
+    has_args = has_kwargs = False
+    for param in params.values():
+        if param.kind == param.VAR_POSITIONAL:
+            has_args = True
+        elif param.kind == param.VAR_KEYWORD:
+            has_kwargs = True
     if has_args and has_kwargs and len(params) == 2:
         # func(*args, **kwargs)
         params = {}  # type: ignore  # changing type of params
@@ -49,15 +64,40 @@ def _callable_signature_to_fields(obj: Callable) -> dict[str, "_CountingAttr"]:
         attrs_fields = {}
 
     # find defaults
-    defaults = {p.name: p.default if p.default != inspect._empty else attrs.NOTHING for p in params.values()}
-    defaults.update(
-        {k: v.default for k, v in attrs_fields.items()}
-    )  # attrs fields take precedence, default may be factory
+    defaults: dict[str, Any] = {}
+    for param in params.values():
+        attrs_field = attrs_fields.pop(param.name, None)
+        if attrs_field is not None:
+            defaults[param.name] = attrs_field.default  # attrs fields take precedence, default may be factory
+        else:
+            defaults[param.name] = param.default if param.default != inspect._empty else attrs.NOTHING
+    # attrs fields missing in the signature
+    for name, attrs_field in attrs_fields.items():
+        defaults[name] = attrs_field.default
+
+    result = tuple(defaults.items())
+    try:
+        _signature_defaults_cache[obj] = result
+    except TypeError:
+        pass  # obj cannot be weakly referenced, do not cache
 
-    # build fields
-    fields = {param_name: field(default=default, kw_only=True) for param_name, default in defaults.items()}
+    return result
 
-    return fields
+
+def _callable_signature_to_fields(obj: Callable) -> dict[str, "_CountingAttr"]:
+    """Return list of attrs fields corresponding to function arguments.
+
+    :param func: Function to be analyzed. Cannot contain variadic args or kwargs
+        unless the signature is func(*args, **kwargs) in which case they are ommited.
+    :returns: List of function arguments described by attrs fields.
+    :raises ValueError: Function accepts positional-only arguments.
+    :raises NotImplementedError: Function accepts **kwargs.
+    """
+    # build new fields on every call, they are consumed by the class that is being built
+    return {
+        param_name: field(default=default, kw_only=True)
+        for param_name, default in _callable_signature_to_defaults(obj)
+    }
 
 
 def _check_fields_compatibility(
@@ -76,15 +116,14 @@ def _check_fields_compatibility(
     ...
 
 
-def _extract_fields(obj: Any, forbidden_names: Iterable[str] | None = None) -> dict[str, "_CountingAttr"]:
+def _extract_fields(obj: Any, forbidden_names: Set[str] = frozenset()) -> dict[str, "_CountingAttr"]:
     """Find attrs fields corresponding to input parameters of a function/class.
 
     :param obj: Function or class to be analyzed.
-    :param forbidden_names: Names that cannot be used as input parameters.
+    :param forbidden_names: Names that cannot be used as input parameters, e.g. a frozenset or dict keys.
     :returns: List of function arguments described by attrs fields.
     :raises ValueError: Function arguments collide with forbidden_names.
     """
-    forbidden_names = forbidden_names or []
 
     if isinstance(obj, partial):
         if obj.args:
@@ -96,10 +135,10 @@ def _extract_fields(obj: Any, forbidden_names: Iterable[str] | None = None) -> d
         # dataset class => copy input parameters
         fields = _callable_signature_to_fields(obj)
 
-        colliding_names = set(fields) & set(forbidden_names)
+        colliding_names = fields.keys() & forbidden_names
         if colliding_names:
             raise ValueError(
-                "Dataset arguments {colliding_names} collide with internal names. Please use different ones."
+                f"Dataset arguments {colliding_names} collide with internal names. Please use different ones."
             )
     else:
         fields = {}
@@ -107,7 +146,17 @@ def _extract_fields(obj: Any, forbidden_names: Iterable[str] | None = None) -> d
     return fields
 
 
-def _build_constant_property(obj: Any) -> property:
+class _ConstantProperty(staticmethod):
+    """Read-only class attribute that returns the stored object both from the class and its instances.
+
+    Unlike a property, the value is returned by a C-level descriptor without calling any Python function.
+    """
+
+    # do not inherit abstractness of the stored object
+    __isabstractmethod__ = False
+
+
+def _build_constant_property(obj: Any) -> _ConstantProperty:
     """This function allows creating properties inside a loop such as
 
     for obj in objs:
@@ -119,7 +168,7 @@ def _build_constant_property(obj: Any) -> property:
         properties.append(lambda self: obj)
 
     all the properties would return the last element of objs. Calling one _build_constant_property
-    on the other hand creates a closure that remembers the correct value of obj.
+    on the other hand creates a descriptor that remembers the correct value of obj.
     """
 
-    return property(lambda self: obj)
+    return _ConstantProperty(obj)
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 from typing import Any, Callable, Type
-from collections.abc import Collection
+import atexit
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+import threading
 
-from attrs import converters, define, field, fields
+from attrs import converters, define, field, fields, validators
 from joblib import Parallel, delayed
 
 from downsat.etl import WeakIdKeyDictionary, types
@@ -11,6 +14,85 @@ from downsat.etl import WeakIdKeyDictionary, types
 
 RUN_CONTEXT_DUNDER = "_etl_run_context_"
 _global_context_dict: WeakIdKeyDictionary = WeakIdKeyDictionary()
+_run_context_cache: WeakIdKeyDictionary = WeakIdKeyDictionary()  # RunContext.from_obj results
+# pools shared by all threads, closed at program exit
+_parallel_pools: dict[tuple[int, str], tuple[Parallel, threading.Lock]] = {}  # by (n_jobs, backend)
+_thread_pools: dict[int, ThreadPoolExecutor] = {}  # by max_workers
+_pools_lock = threading.Lock()
+_worker_thread = threading.local()  # `in_pool` is True in worker threads of `_get_thread_pool` pools
+
+
+def _run_parallel(n_jobs: int, backend: str, batch_size: int | str, tasks: list[Any]) -> list[Any]:
+    """Run tasks in joblib.Parallel pool with given number of jobs and backend that is reused across calls.
+
+    The pool is entered on creation so that its workers stay alive between calls. Single Parallel instance
+    cannot be run concurrently => if the shared pool is busy (another thread or a nested call), a temporary
+    pool is used for this call only.
+
+    :param n_jobs: Number of parallel jobs.
+    :param backend: Joblib backend, e.g. "loky".
+    :param batch_size: Number of tasks dispatched to a worker at once.
+    :param tasks: Delayed tasks.
+    :returns: Results of the tasks.
+    """
+    try:
+        parallel, lock = _parallel_pools[n_jobs, backend]
+    except KeyError:
+        with _pools_lock:
+            if (n_jobs, backend) not in _parallel_pools:
+                parallel = Parallel(n_jobs=n_jobs, backend=backend)
+                parallel.__enter__()
+                _parallel_pools[n_jobs, backend] = (parallel, threading.Lock())
+            parallel, lock = _parallel_pools[n_jobs, backend]
+
+    if not lock.acquire(blocking=False):
+        # shared pool is busy => temporary pool, closed by joblib after the call
+        return Parallel(n_jobs=n_jobs, backend=backend, batch_size=batch_size)(tasks)
+
+    try:
+        parallel.batch_size = batch_size
+        return parallel(tasks)
+    finally:
+        lock.release()
+
+
+def _mark_worker_thread() -> None:
+    """Initializer of worker threads of `_get_thread_pool` pools."""
+    _worker_thread.in_pool = True
+
+
+def _get_thread_pool(max_workers: int) -> ThreadPoolExecutor:
+    """Return thread pool with given number of workers that is shared by all threads.
+
+    A pool is kept for every distinct number of workers => callers should use a fixed number of workers
+    rather than one derived from the number of items. Pools are shut down at program exit.
+
+    Note: Nested `RunContext.map` calls must not wait for the pool they run in, see `_worker_thread`.
+
+    :param max_workers: Number of worker threads.
+    :returns: Thread pool.
+    """
+    try:
+        return _thread_pools[max_workers]
+    except KeyError:
+        with _pools_lock:
+            if max_workers not in _thread_pools:
+                _thread_pools[max_workers] = ThreadPoolExecutor(
+                    max_workers=max_workers, initializer=_mark_worker_thread
+                )
+            return _thread_pools[max_workers]
+
+
+@atexit.register
+def _close_parallel_pools() -> None:
+    """Close all pools opened by `_run_parallel` and `_get_thread_pool`."""
+    with _pools_lock:
+        while _parallel_pools:
+            parallel, _ = _parallel_pools.popitem()[1]
+            parallel.__exit__(None, None, None)
+
+        while _thread_pools:
+            _thread_pools.popitem()[1].shutdown(wait=False)
 
 
 @define
@@ -20,16 +102,38 @@ class RunContext:
     :param num_workers: Number of workers to use for parallel jobs.
     :param max_workers: Maximum number of workers to use for parallel jobs.
         Takes precedence over num_workers.
+    :param batch_size_factor: Number of batches dispatched to each worker during parallel processing.
+        Higher values balance the load better, lower values reduce the dispatching overhead.
+    :param backend: Joblib backend used for parallel jobs. Default is "threading" which suits I/O-bound
+        datasources (downloads, disk reads). Use `setcontext(backend="loky")` or `"multiprocessing"`
+        for CPU-bound transforms.
 
     # TODO: test
     """
 
     num_workers: int | None = field(default=None, converter=converters.optional(int), kw_only=True)
     max_workers: int | None = field(default=None, converter=converters.optional(int), kw_only=True)
+    batch_size_factor: int = field(default=4, converter=int, validator=validators.gt(0), kw_only=True)
+    backend: str = field(default="threading", converter=str, kw_only=True)
 
     @classmethod
     def from_obj(cls, obj: Any) -> RunContext:
-        return cls(**getcontext(obj))
+        """Build run context of given object.
+
+        The result is cached for each object and invalidated by `setcontext`.
+
+        :param obj: Object whose run context is being built.
+        :returns: Run context of the object.
+        """
+        run_context = _run_context_cache.get(obj)
+        if run_context is None or type(run_context) is not cls:
+            run_context = cls(**getcontext(obj))
+            try:
+                _run_context_cache[obj] = run_context
+            except TypeError:
+                pass  # obj cannot be weakly referenced, do not cache
+
+        return run_context
 
     def get_num_workers(self) -> int | None:
         """Get number of workers to be used for parallel computing."""
@@ -41,38 +145,70 @@ class RunContext:
             else:
                 return min(self.num_workers, self.max_workers)
 
+    def get_batch_size(self, num_workers: int, num_items: int) -> int | str:
+        """Get number of items dispatched to a worker at once during parallel computing.
+
+        :param num_workers: Number of parallel workers.
+        :param num_items: Number of items to be processed.
+        :returns: Batch size or "auto" to let joblib decide if there are too few items to be batched.
+        """
+        if num_items < num_workers * 2:
+            return "auto"
+
+        return max(1, num_items // (num_workers * self.batch_size_factor))
+
     def map(
-        self, fun: Callable[[types.InputType], types.OutputType], container: Collection[types.InputType]
+        self, fun: Callable[[types.InputType], types.OutputType], container: Iterable[types.InputType]
     ) -> tuple[types.OutputType, ...]:
         """Apply funciton on all elements of an iterable.
 
-        Uses joblib.Parallel if min(self.num_workers, self.max_workers) > 1.
+        Runs in parallel if min(self.num_workers, self.max_workers) > 1: using a thread pool
+        for the "threading" backend and joblib.Parallel otherwise.
 
         :param fun: Function to be applied.
-        :param container: Iterable.
+        :param container: Iterable. Iterated only once, can be a generator.
         :returns: Tuple of results.
-
-        # TODO: allow selecting different parallel backend
         """
+        items = container if isinstance(container, (list, tuple)) else list(container)
+        num_items = len(items)
         num_workers = self.get_num_workers()
-        if num_workers is None:
-            # set default number of workers
-            # TODO: if the parallel processing branch below would execute the paralelization within
-            #       `with context(num_workers=1):` or `with context(num_workers=num_workers-len(container)):`
-            #       and self.get_num_workers() in subtasks would take this number of num_workers as default, we could guarantee
-            #       that the whole chain will use max num_workers unless some of the subcomponents overrides that by specifying
-            #       its own number of workers
-            # TODO: use some global switch to change to num_workers = -1 as default (i.e. use all CPUs as default)
-            num_workers = 1
-
-        if num_workers > 1 and len(container) > 1:
-            # parallel processing
-            results = Parallel(n_jobs=num_workers)(delayed(fun)(item) for item in container)
-        else:
-            # serial processing
-            results = [fun(item) for item in container]
+        # TODO: if the parallel processing branch below would execute the paralelization within
+        #       `with context(num_workers=1):` or `with context(num_workers=num_workers-len(container)):`
+        #       and self.get_num_workers() in subtasks would take this number of num_workers as default, we could guarantee
+        #       that the whole chain will use max num_workers unless some of the subcomponents overrides that by specifying
+        #       its own number of workers
+        # TODO: use some global switch to change to num_workers = -1 as default (i.e. use all CPUs as default)
+        if num_workers is None or num_workers <= 1 or num_items <= 1:
+            # serial processing (default), do not touch joblib at all
+            return tuple([fun(item) for item in items])
+
+        if self.backend == "threading":
+            if getattr(_worker_thread, "in_pool", False):
+                # nested call in a worker of a shared pool: waiting for the pools could deadlock => serial
+                return tuple([fun(item) for item in items])
 
-        return tuple(results)
+            # parallel processing in threads, joblib dispatching and batching is not needed
+            return tuple(_get_thread_pool(num_workers).map(fun, items))
+
+        # wrap the function only once, items are already materialized => build the tasks upfront
+        delayed_fun = delayed(fun)
+        tasks = [delayed_fun(item) for item in items]
+
+        # parallel processing
+        return tuple(
+            _run_parallel(num_workers, self.backend, self.get_batch_size(num_workers, num_items), tasks)
+        )
+
+
+def _get_local_context(obj: Any) -> dict[str, Any] | None:
+    """Get context dictionary stored directly in the object under `RUN_CONTEXT_DUNDER`.
+
+    Only the object's own attribute is used, a context dictionary inherited from its class is ignored.
+
+    :param obj: Object whose context is being queried.
+    :returns: Context dictionary of the object or None if the object does not store it locally.
+    """
+    return getattr(obj, "__dict__", {}).get(RUN_CONTEXT_DUNDER)
 
 
 def getcontext(obj: Type[Any]) -> dict[str, Any]:
@@ -81,14 +217,21 @@ def getcontext(obj: Type[Any]) -> dict[str, Any]:
     Merges context values stored locally in the object and those in the global
     context dict. Local objects have priority in case of conflict.
 
+    The returned dictionary may be the one in which the context is stored and must not be modified.
+    Use `setcontext` to update the context.
+
     :param obj: Object whose context is being queried.
     :returns: Context dictionary of the object.
     """
-    context = _global_context_dict.get(obj, {})
-    class_context = getattr(obj, RUN_CONTEXT_DUNDER, {})
-    context.update(class_context)
+    class_context = _get_local_context(obj)
+    global_context = _global_context_dict.get(obj) if _global_context_dict else None
 
-    return context
+    if not global_context:
+        return class_context or {}
+    elif not class_context:
+        return global_context
+    else:
+        return {**global_context, **class_context}
 
 
 def setcontext(_strict: bool = True, **kwargs: Any) -> Callable[[Any], None]:
@@ -109,18 +252,19 @@ def setcontext(_strict: bool = True, **kwargs: Any) -> Callable[[Any], None]:
             raise ValueError(f"Invalid run context property: {invalid_names}")
 
     def _setcontext(obj: Any) -> None:
-        try:
+        # try to store in an object attribute
+        context = _get_local_context(obj)
+        if context is None:
             try:
-                # try to store in an object attribute
-                context = getattr(obj, RUN_CONTEXT_DUNDER)
-            except AttributeError:
                 # not possible, store in the global context dict
-                _global_context_dict.setdefault(obj, {})
-                context = _global_context_dict[obj]
-        except Exception as e:
-            # all failed
-            raise TypeError(f"Cannot set context for object of type {type(obj)}. ") from e
+                context = _global_context_dict.setdefault(obj, {})
+            except Exception as e:
+                # all failed
+                raise TypeError(f"Cannot set context for object of type {type(obj)}. ") from e
 
         context.update(kwargs)
 
+        # invalidate cached run context of the object
+        _run_context_cache.pop(obj)
+
     return _setcontext
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
-from typing import Any, Optional, Union
-import atexit
-from collections.abc import Mapping
-from functools import singledispatch
+from typing import Any, Callable, Optional, Union
+from collections.abc import Iterable, Mapping
+from functools import partial
 from io import BytesIO, StringIO
 import os
 from pathlib import Path
 import shutil
+import stat
 import tempfile
+import threading
+import uuid
 
 
 try:
@@ -19,12 +21,22 @@ else:
     satpy_installed = True
 from trollsift import Parser
 
+from downsat.etl.context import RunContext
 from downsat.etl.metadata import getmeta, keepmeta
 from downsat.etl.protocols import Dataset
+from downsat.etl.utils.dispatch import typedispatch
 from downsat.etl.weakref import List as MetaList
 from downsat.etl.weakref import Path as MetaPath
 
 
+_COPY_BUFFER_SIZE = 1024 * 1024  # size of chunks used when streaming data to a file
+_MAX_IO_WORKERS = os.cpu_count() or 4  # max number of threads used to save collections to filesystem
+_PATH_TYPE = type(Path())  # concrete class of Path objects, e.g. PosixPath
+_temp_dir: tempfile.TemporaryDirectory | None = (
+    None  # shared directory for temporary files, see `_get_temp_dir`
+)
+_temp_dir_lock = threading.Lock()
+
 MetaPathOrMetaPathCollection = Union[
     MetaPath,
     MetaList["MetaPathOrMetaPathCollection"],
@@ -33,7 +45,7 @@ MetaPathOrMetaPathCollection = Union[
 ]
 
 
-@singledispatch
+@typedispatch
 def to_stringio(input: Any) -> StringIO:
     """Convert input to StringIO.
 
@@ -74,10 +86,18 @@ def _(input: list) -> StringIO:
     :param input: Input to be converted.
     :return: StringIO.
     """
-    return StringIO("\n".join(to_stringio(v).getvalue() for v in input))
+    # write the elements directly to the output buffer instead of joining them to a string first
+    output = StringIO()
+    for i, value in enumerate(input):
+        if i > 0:
+            output.write("\n")
+        output.write(to_stringio(value).getvalue())
+
+    output.seek(0)
+    return output
 
 
-@singledispatch
+@typedispatch
 def to_path(input: Any) -> MetaPathOrMetaPathCollection:
     """Convert input to Path .
 
@@ -108,6 +128,24 @@ def _(input: Path) -> MetaPath:
     return MetaPath(input)
 
 
+def _map_to_path(input: tuple | list | set) -> Iterable[MetaPathOrMetaPathCollection]:
+    """Apply `to_path` on all items of a collection.
+
+    Collections of paths only are converted without dispatching `to_path` on each item.
+
+    :param input: Collection of items to be converted to Paths.
+    :return: Iterable of converted items.
+    """
+    if all(type(v) is MetaPath for v in input):
+        # MetaPaths are returned as they are
+        return input
+    elif all(type(v) is _PATH_TYPE for v in input):
+        # plain paths cannot store any metadata => no metadata to be kept
+        return map(MetaPath, input)
+    else:
+        return map(to_path, input)
+
+
 @to_path.register
 def _(input: tuple) -> MetaPathOrMetaPathCollection:
     """Convert tuple to tuple of Paths.
@@ -115,7 +153,7 @@ def _(input: tuple) -> MetaPathOrMetaPathCollection:
     :param input: Input to be converted to tuple of Paths.
     :return: Tuple of Paths.
     """
-    return tuple(to_path(v) for v in input)  # TODO: map?
+    return tuple(_map_to_path(input))
 
 
 @to_path.register
@@ -128,7 +166,7 @@ def _(input: list) -> MetaPathOrMetaPathCollection:
     :param input: Input to be converted.
     :return: List of Paths.
     """
-    return MetaList([to_path(v) for v in input])  # TODO: map?
+    return MetaList(_map_to_path(input))
 
 
 @to_path.register
@@ -141,10 +179,10 @@ def _(input: set) -> MetaPathOrMetaPathCollection:
     :param input: Input to be converted.
     :return: Set of Paths.
     """
-    return set(to_path(v) for v in input)  # TODO: map?
+    return set(_map_to_path(input))
 
 
-@singledispatch
+@typedispatch
 def to_filesystem(
     input: Any,
     filename: Optional[Union[Path, str]] = None,
@@ -164,9 +202,66 @@ def to_filesystem(
     raise NotImplementedError(f"Cannot convert {type(input)} to filesystem file or folder.")
 
 
-def _cleanup_temp_dir(dir_path: str | os.PathLike) -> None:
-    if os.path.exists(dir_path):
-        shutil.rmtree(dir_path)
+def _item_to_filesystem(
+    item: tuple[Any, Optional[Union[Path, str]]],
+    mkdir: bool,
+    overwrite: bool,
+    metacache: Optional[Dataset],
+) -> MetaPathOrMetaPathCollection:
+    """Save single (input, filename) pair using `to_filesystem`."""
+    input, filename = item
+    return to_filesystem(input, filename, mkdir=mkdir, overwrite=overwrite, metacache=metacache)
+
+
+def _map_to_filesystem(
+    items: list[tuple[Any, Optional[Union[Path, str]]]],
+    mkdir: bool = False,
+    overwrite: bool = False,
+    metacache: Optional[Dataset] = None,
+) -> tuple[MetaPathOrMetaPathCollection, ...]:
+    """Save multiple objects using `to_filesystem`.
+
+    Saving is mostly IO-bound => larger collections are saved in parallel threads. Metadata are collected
+    in a local dictionary and written to metacache at once from the calling thread, i.e. metacache does
+    not need to be thread-safe.
+
+    :param items: List of (input, filename) pairs.
+    :param mkdir: Whether to create parent directories.
+    :param overwrite: Whether to overwrite existing files or raise an error.
+    :param metacache: Dataset to be used as a cache for metadata. Optional.
+    :return: Tuple of results of `to_filesystem` in the order of items.
+    """
+    # Note: fixed number of workers so that the same thread pool is reused for all collections
+    num_workers = _MAX_IO_WORKERS if len(items) > 2 else 1
+    run_context = RunContext(num_workers=num_workers, backend="threading")
+    collected_metadata: dict[MetaPath, dict[str, Any]] | None = {} if metacache is not None else None
+
+    results = run_context.map(
+        partial(_item_to_filesystem, mkdir=mkdir, overwrite=overwrite, metacache=collected_metadata), items
+    )
+
+    if metacache is not None:
+        for path, metadata in collected_metadata.items():  # type: ignore  # not None if metacache is not None
+            metacache[path] = metadata
+
+    return results
+
+
+def _get_temp_dir() -> str:
+    """Return path of a temporary directory shared by the whole process.
+
+    The directory is created on the first call and removed at program exit.
+
+    :return: Path of the directory.
+    """
+    global _temp_dir
+
+    if _temp_dir is None:
+        with _temp_dir_lock:
+            if _temp_dir is None:
+                _temp_dir = tempfile.TemporaryDirectory(prefix="downsat-")
+
+    return _temp_dir.name
 
 
 def _get_filename(filename: Optional[Union[Path, str, Parser]], metadata: dict[str, Any]) -> MetaPath:
@@ -177,11 +272,8 @@ def _get_filename(filename: Optional[Union[Path, str, Parser]], metadata: dict[s
     :return: MetaPath.
     """
     if filename is None:
-        temp_dir = tempfile.mkdtemp()
-        atexit.register(_cleanup_temp_dir, temp_dir)  # clean up at program axit
-
-        temp_file = Path(temp_dir) / "temp_file"
-        return MetaPath(temp_file)
+        # unique file in the shared temporary directory
+        return MetaPath(_get_temp_dir()) / uuid.uuid4().hex
 
     if isinstance(filename, Parser):
         return MetaPath(filename.format(**metadata))
@@ -198,8 +290,13 @@ def _check_filename(filename: Path | str, mkdir: bool, overwrite: bool) -> None:
     :raises FileExistsError: The file exists and overwrite is False.
     """
     filename = Path(filename)
-    if filename.exists():
-        if filename.is_dir():
+    try:
+        file_stat = os.stat(filename)  # single stat call instead of exists() and is_dir()
+    except (FileNotFoundError, NotADirectoryError):
+        file_stat = None
+
+    if file_stat is not None:
+        if stat.S_ISDIR(file_stat.st_mode):
             raise FileExistsError(f"File {filename} is a directory.")
 
         if not overwrite:
@@ -211,9 +308,33 @@ def _check_filename(filename: Path | str, mkdir: bool, overwrite: bool) -> None:
         filename.parent.mkdir(exist_ok=True, parents=True)  # TODO: introduce mkdir_parents parameter
 
 
+def _write_text_stream(input: StringIO, filename: Path) -> None:
+    """Write text stream to a file in chunks.
+
+    :param input: Text stream, written from its current position.
+    :param filename: Output filename.
+    """
+    with open(filename, "wt") as f:
+        shutil.copyfileobj(input, f, length=_COPY_BUFFER_SIZE)
+
+
+def _write_bytes_stream(input: BytesIO, filename: Path) -> None:
+    """Write binary stream to a file.
+
+    Note: BytesIO created from bytes and read from position 0 returns the very same bytes object
+    until the buffer is modified => the data are not copied. `getbuffer` would copy them.
+
+    :param input: Binary stream, written from its current position.
+    :param filename: Output filename.
+    """
+    with open(filename, "wb") as f:
+        f.write(input.read())
+
+
 def _stream_to_filesystem(
     input: StringIO | BytesIO,
     filename: Path,
+    write: Callable[[Any, Path], None],
     mkdir: bool = False,
     overwrite: bool = False,
     metacache: Optional[Dataset] = None,
@@ -222,6 +343,7 @@ def _stream_to_filesystem(
 
     :param input: Input to be saved.
     :param filename: Output filename.
+    :param write: Function writing the stream to a file, `_write_text_stream` or `_write_bytes_stream`.
     :param mkdir: Whether to create parent directories.
     :param overwrite: Whether to overwrite existing file or raise an error.
     :param metacache: Dataset to be used as a cache for metadata. Optional.
@@ -231,12 +353,10 @@ def _stream_to_filesystem(
     filename = MetaPath(filename)
 
     input.seek(0)
-    mode = "t" if isinstance(input, StringIO) else "b"
 
     _check_filename(filename=filename, mkdir=mkdir, overwrite=overwrite)
 
-    with open(filename, "w" + mode) as f:
-        f.write(input.read())
+    write(input, filename)
 
     # save metadata
     if metacache is not None:
@@ -302,7 +422,12 @@ def _(
     """
     proper_filename = _get_filename(filename, metadata=getmeta(input))
     return _stream_to_filesystem(
-        input=input, filename=proper_filename, mkdir=mkdir, overwrite=overwrite, metacache=metacache
+        input=input,
+        filename=proper_filename,
+        write=_write_text_stream,
+        mkdir=mkdir,
+        overwrite=overwrite,
+        metacache=metacache,
     )
 
 
@@ -327,7 +452,12 @@ def _(
     """
     proper_filename = _get_filename(filename, metadata=getmeta(input))
     return _stream_to_filesystem(
-        input=input, filename=proper_filename, mkdir=mkdir, overwrite=overwrite, metacache=metacache
+        input=input,
+        filename=proper_filename,
+        write=_write_bytes_stream,
+        mkdir=mkdir,
+        overwrite=overwrite,
+        metacache=metacache,
     )
 
 
@@ -360,8 +490,12 @@ def _(
             raise FileExistsError(f"Folder {filename} already exists. Set overwrite=True to overwrite.")
 
     folder.mkdir(parents=mkdir)
-    for key, value in input.items():
-        to_filesystem(value, folder / key, mkdir=mkdir, overwrite=overwrite, metacache=metacache)
+    _map_to_filesystem(
+        [(value, folder / key) for key, value in input.items()],
+        mkdir=mkdir,
+        overwrite=overwrite,
+        metacache=metacache,
+    )
 
     if metacache is not None:
         metacache[folder] = getmeta(input)
@@ -392,9 +526,8 @@ def _(
     if filename is not None:
         raise NotImplementedError("Cannot save tuple of objects to a single file.")
 
-    return tuple(
-        to_filesystem(v, filename=filename, mkdir=mkdir, overwrite=overwrite, metacache=metacache)
-        for v in input
+    return _map_to_filesystem(
+        [(v, filename) for v in input], mkdir=mkdir, overwrite=overwrite, metacache=metacache
     )
 
 
@@ -422,8 +555,9 @@ def _(
         raise NotImplementedError("Cannot save tuple of objects to a single file.")
 
     return set(
-        to_filesystem(v, filename=filename, mkdir=mkdir, overwrite=overwrite, metacache=metacache)
-        for v in input
+        _map_to_filesystem(
+            [(v, filename) for v in input], mkdir=mkdir, overwrite=overwrite, metacache=metacache
+        )
     )
 
 
@@ -460,7 +594,7 @@ if satpy_installed:
         return proper_filename
 
 
-@singledispatch
+@typedispatch
 def to_parser(input: Any) -> Parser:  # noqa: U100
     """Convert input to Parser."""
     raise NotImplementedError(f"Cannot convert {type(input)} to Parser.")
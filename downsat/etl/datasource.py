@@ -45,19 +45,56 @@ class MultiDataSource(MultiKeyDataSource[types.KeyType_contra, types.OutputType_
         :returns: Item or items.
         """
         if isinstance(key, tuple):
-            return tuple(self[k] for k in key)  # type: ignore # TODO: use mapping
+            # multiple keys, nested tuples are resolved recursively
+            return tuple([self[k] if isinstance(k, tuple) else self._getitem_single(k) for k in key])  # type: ignore  # TODO: fix
         else:
-            values = []
-            for datasource in self.datasources:
-                try:
-                    values.append(datasource[key])
-                except KeyError:
-                    pass
-                else:
-                    if self.search_strategy == KeySearchStrategy.FIRST:
-                        break
-
-            if len(values) == 0:
-                raise KeyError(key)
-            else:
-                return tuple(set(flatten(tuple(values), depth=1)))  # type: ignore  # TODO: fix
+            return self._getitem_single(key)
+
+    def _getitem_single(self, key: types.KeyType_contra) -> tuple[types.OutputType_co, ...]:
+        """Return unique items for a single key from the sub-datasources.
+
+        :param key: Index or id of the item.
+        :returns: Flattened tuple of unique items.
+        :raises KeyError: Key not found in any of the sub-datasources.
+        """
+        if self.search_strategy == KeySearchStrategy.FIRST:
+            values = self._get_first(key)
+        else:
+            values = self._get_all(key)
+
+        # unique values in order of the datasources
+        return tuple(dict.fromkeys(flatten(values, depth=1)))  # type: ignore  # TODO: fix
+
+    def _get_first(self, key: types.KeyType_contra) -> tuple[types.OutputType_co]:
+        """Return the item from the first sub-datasource containing the key.
+
+        :param key: Index or id of the item.
+        :returns: Tuple with the item.
+        :raises KeyError: Key not found in any of the sub-datasources.
+        """
+        for datasource in self.datasources:
+            try:
+                return (datasource[key],)
+            except KeyError:
+                pass
+
+        raise KeyError(key)
+
+    def _get_all(self, key: types.KeyType_contra) -> tuple[types.OutputType_co, ...]:
+        """Return items from all sub-datasources containing the key.
+
+        :param key: Index or id of the item.
+        :returns: Tuple of the items.
+        :raises KeyError: Key not found in any of the sub-datasources.
+        """
+        values = []
+        for datasource in self.datasources:
+            try:
+                values.append(datasource[key])
+            except KeyError:
+                pass
+
+        if not values:
+            raise KeyError(key)
+
+        return tuple(values)
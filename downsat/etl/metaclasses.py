@@ -10,6 +10,9 @@ import inspect
 
 
 memoized_metaclasses_map: dict[tuple[Type, ...], Type] = {}  # result cache
+_metas_to_metaclass_map: dict[
+    tuple[Type, ...], Type
+] = {}  # result cache indexed by metaclasses before reduction
 
 
 def _skip_redundant(iterable: Iterable, skipset: set | None = None) -> Generator[Any, None, None]:
@@ -54,14 +57,22 @@ def get_noconflict_metaclass(
     """
     # make tuple of needed metaclasses in specified priority order
     metas = left_metas + tuple(map(type, bases)) + right_metas
+    try:
+        # skip removing redundant metaclasses if already done for the same metaclasses
+        return _metas_to_metaclass_map[metas]
+    except KeyError:
+        pass
+
     needed_metas = _remove_redundant(metas)
 
     # return existing confict-solving meta, if any
     if needed_metas in memoized_metaclasses_map:
-        return memoized_metaclasses_map[needed_metas]
+        meta: Type = memoized_metaclasses_map[needed_metas]
+        _metas_to_metaclass_map[metas] = meta
+        return meta
     # nope: compute, memoize and return needed conflict-solving meta
     elif not needed_metas:  # wee, a trivial case, happy us
-        meta: Type = type
+        meta = type
     elif len(needed_metas) == 1:  # another trivial case
         meta = needed_metas[0]
     # check for recursion, can happen i.e. for Zope ExtensionClasses
@@ -71,6 +82,7 @@ def get_noconflict_metaclass(
         metaname = "_" + "".join([m.__name__ for m in needed_metas])
         meta = classmaker()(metaname, needed_metas, {})
     memoized_metaclasses_map[needed_metas] = meta
+    _metas_to_metaclass_map[metas] = meta
     return meta
 
 
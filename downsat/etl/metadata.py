@@ -1,18 +1,19 @@
 from __future__ import annotations
 
 from typing import Any, Callable
-from functools import singledispatch, wraps
+from functools import wraps
 
 from typing_extensions import Concatenate
 
 from downsat.etl import WeakIdKeyDictionary, types
+from downsat.etl.utils.dispatch import typedispatch
 
 
 METADATA_DUNDER = "attrs"
 _global_metadata_dict: WeakIdKeyDictionary = WeakIdKeyDictionary()
 
 
-@singledispatch
+@typedispatch
 def get_local_metadata(obj: Any) -> dict[str, Any]:
     """Get local metadata dict or raise AttributeError.
 
@@ -24,7 +25,10 @@ def get_local_metadata(obj: Any) -> dict[str, Any]:
     return getattr(obj, METADATA_DUNDER)
 
 
-@singledispatch
+_default_get_local_metadata = get_local_metadata.registry[object]  # type: ignore  # typedispatch attribute
+
+
+@typedispatch
 def set_local_metadata(obj: Any, **kwargs: Any) -> None:
     """Default implementation of set_local_metadata that tries to modify the object.
 
@@ -47,7 +51,7 @@ def set_local_metadata(obj: Any, **kwargs: Any) -> None:
     metadata_dict.update(kwargs)
 
 
-@singledispatch
+@typedispatch
 def clear_local_metadata(obj: Any) -> None:
     """Clear locally stored metadata.
 
@@ -62,6 +66,42 @@ def clear_local_metadata(obj: Any) -> None:
         metadata.clear()
 
 
+def _find_local_metadata(obj: Any) -> dict[str, Any] | None:
+    """Get local metadata dict or None if it does not exist.
+
+    Avoids raising and catching AttributeError for objects handled by the default `get_local_metadata`.
+
+    :param obj: Object whose metadata are to be retrieved.
+    :returns: Local metadata dict or None.
+    """
+    get_local = get_local_metadata.dispatch(obj.__class__)  # type: ignore  # typedispatch attribute
+    if get_local is _default_get_local_metadata:
+        return getattr(obj, METADATA_DUNDER, None)
+
+    try:
+        return get_local(obj)
+    except AttributeError:
+        return None
+
+
+def _merge_metadata(
+    global_metadata: dict[str, Any] | None, local_metadata: dict[str, Any] | None
+) -> dict[str, Any]:
+    """Merge global and local metadata of an object into a new dictionary.
+
+    :param global_metadata: Metadata from the global metadata dict or None.
+    :param local_metadata: Local metadata or None.
+    :returns: Copy of the merged metadata, local metadata have priority.
+    """
+    # copy only once
+    if not global_metadata:
+        return dict(local_metadata) if local_metadata else {}
+    elif not local_metadata:
+        return dict(global_metadata)
+    else:
+        return {**global_metadata, **local_metadata}
+
+
 def getmeta(obj: Any) -> dict[str, Any]:
     """Get metadata values of given object.
 
@@ -76,22 +116,15 @@ def getmeta(obj: Any) -> dict[str, Any]:
 
     # TODO: merge implementation with getcontext
     """
-    metadata = _global_metadata_dict.get(obj, {}).copy()
-    try:
-        local_metadata = get_local_metadata(obj)
-    except AttributeError:
-        pass
-    else:
-        metadata.update(local_metadata)
-
-    return metadata
+    global_metadata = _global_metadata_dict.get(obj) if _global_metadata_dict else None
+    return _merge_metadata(global_metadata, _find_local_metadata(obj))
 
 
 def setmeta(obj: Any, **kwargs: Any) -> None:
     """Set metadata on an object.
 
-    The properties are stored either in global context dictionary or localy using singledispatch function
-    that can be overloaded for specific data types but stores the metadata by default in a property with
+    The properties are stored either in global context dictionary or localy using generic function
+    (see `downsat.etl.utils.dispatch.typedispatch`) that can be overloaded for specific data types but stores the metadata by default in a property with
     name given in `downsat.etl.metadata.METADATA_DUNDER`.
 
     `setmeta` adds updates existing metadata dictionary, i.e. does not delete keys not given in kwargs.
@@ -106,8 +139,7 @@ def setmeta(obj: Any, **kwargs: Any) -> None:
         set_local_metadata(obj, **kwargs)
     except TypeError:
         # not possible, store in the global context dict
-        _global_metadata_dict.setdefault(obj, {})
-        _global_metadata_dict[obj].update(kwargs)
+        _global_metadata_dict.setdefault(obj, {}).update(kwargs)
 
 
 def clearmeta(obj: Any) -> None:
@@ -136,7 +168,13 @@ def keepmeta(
     def wrapper(
         input: types.InputType, *args: types.Params.args, **kwargs: types.Params.kwargs
     ) -> types.OutputType:
-        metadata = getmeta(input)
+        global_metadata = _global_metadata_dict.get(input) if _global_metadata_dict else None
+        local_metadata = _find_local_metadata(input)
+        if not global_metadata and not local_metadata:
+            # fast path: no metadata to be copied
+            return f(input, *args, **kwargs)
+
+        metadata = _merge_metadata(global_metadata, local_metadata)
         output = f(input, *args, **kwargs)
         setmeta(output, **metadata)
 
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 from typing import Any, Callable, Dict, Generic, Sequence, Tuple, Union
+from functools import partial
 from io import BytesIO
-from zipfile import ZipFile
+import os
+from zipfile import ZipFile, ZipInfo
 
 from attrs import field, frozen
 from attrs.validators import gt
 
 from downsat.etl import abc, types
+from downsat.etl.context import RunContext
 from downsat.etl.metadata import getmeta, setmeta
 from downsat.etl.utils.data_manipulation import flatten
 from downsat.etl.weakref import Dict as MetaDict
@@ -30,12 +33,24 @@ class Filter(
 
     def __call__(self, input: Sequence[types.ValueType]) -> list[types.ValueType]:
         metadata = getmeta(input)
-        result = MetaList([v for v in input if self.filter_fun(v, metadata)])  # TODO: map?
+        filter_fun = self.filter_fun
+        result = MetaList([v for v in input if filter_fun(v, metadata)])
         setmeta(result, **metadata)
 
         return result
 
 
+def _extract_zip_member(zf: ZipFile, info: ZipInfo) -> BytesIO:
+    """Extract single file from a zip archive to a memory buffer.
+
+    :param zf: Opened zip archive.
+    :param info: Zip archive member to be extracted.
+    :return: Memory buffer with the extracted file.
+    """
+    with zf.open(info) as f:
+        return BytesIO(f.read())
+
+
 class UnzipBuffer(abc.PipelineTransform[BytesIO, Dict[str, BytesIO]]):
     """Transform that unzips single file from a zip archive to a file-like object or memory buffer."""
 
@@ -57,14 +72,15 @@ class UnzipBuffer(abc.PipelineTransform[BytesIO, Dict[str, BytesIO]]):
 
         # Open the BytesIO object as a zipfile
         with ZipFile(input, mode="r") as zf:
+            infos = zf.infolist()
 
-            # Loop through each file in the zip file
-            for name in zf.namelist():
+            # Extract the files in parallel threads, decompression releases GIL
+            # Note: fixed number of workers so that the same thread pool is reused for all zip files
+            buffers = RunContext(num_workers=os.cpu_count() or 1, backend="threading").map(
+                partial(_extract_zip_member, zf), infos
+            )
 
-                # Open each file as BytesIO and store in the dictionary
-                with zf.open(name) as f:
-                    files[name] = BytesIO(f.read())
-                files[name].seek(0)
+            files.update(zip((info.filename for info in infos), buffers))
 
         setmeta(files, **getmeta(input))
 
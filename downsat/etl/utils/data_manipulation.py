@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+from typing import Any
+from collections.abc import Iterable
+from itertools import chain
+
 from downsat.etl import types
 
 
+_CONTAINERS = (tuple, list, set)  # types of containers expanded by `flatten`
+
+
 def flatten(
     # TODO: recursive definition of the input type to express that each element can be a nested tuple of InputType
     items: types.InputType | tuple[types.InputType, ...],
@@ -19,16 +26,42 @@ def flatten(
     if depth < 1:
         raise ValueError(f"depth must be positive, got {depth}.")
 
-    for _ in range(depth):
-        if isinstance(items, tuple):
-            # (item, ...) or ((item, ...), ...) or (item, (item, ...), ...)
-            # TODO: simplify?
-            items_list = []
-            for item in items:
-                if isinstance(item, (tuple, list, set)):
-                    items_list.extend(list(item))
-                else:
-                    items_list.append(item)
-            items = tuple(items_list)
-
-    return items
+    if not isinstance(items, tuple):
+        return items
+
+    # types are collected at C speed, the (typically few) distinct types are then checked in python
+    item_types = set(map(type, items))
+    if item_types == {tuple}:
+        # fast path: tuple of tuples => concatenate without per-item checks
+        items = tuple(chain.from_iterable(items))
+        return items if depth == 1 else flatten(items, depth=depth - 1)
+
+    if not any(issubclass(item_type, _CONTAINERS) for item_type in item_types):
+        # fast path: already flat => no need to build a new tuple
+        return items
+
+    if depth == 1:
+        # fast path: (item, ...) or (item, (item, ...), ...)
+        return tuple(
+            chain.from_iterable(item if isinstance(item, _CONTAINERS) else (item,) for item in items)
+        )
+
+    # single pass over all the nested containers
+    items_list: list[types.InputType] = []
+    _flatten_into(items, depth, items_list)
+    return tuple(items_list)
+
+
+def _flatten_into(items: Iterable[Any], depth: int, items_list: list[Any]) -> None:
+    """Append flattened items to a list.
+
+    :param items: Container of items or containers.
+    :param depth: Maximum level of flattenings of the items.
+    :param items_list: Output list.
+    """
+    append = items_list.append
+    for item in items:
+        if depth > 0 and isinstance(item, _CONTAINERS):
+            _flatten_into(item, depth - 1, items_list)
+        else:
+            append(item)
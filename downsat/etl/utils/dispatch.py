@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+from abc import get_cache_token
+from functools import singledispatch, update_wrapper
+from weakref import WeakKeyDictionary
+
+
+def typedispatch(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Single-dispatch generic function decorator with fast dispatch on the type of the first argument.
+
+    Works as `functools.singledispatch` (including `register`, `dispatch` and `registry`)
+    but the implementation resolved for each type is memoized and looked up directly in the wrapper,
+    without the extra `dispatch` call of singledispatch. The memo is keyed weakly so that dynamically
+    created classes can still be garbage collected.
+
+    :param func: Default implementation.
+    :returns: Generic function.
+    """
+    dispatcher = singledispatch(func)
+    impls: WeakKeyDictionary[type, Callable[..., Any]] = WeakKeyDictionary()
+    cache_token = None
+
+    def dispatch(cls: type) -> Callable[..., Any]:
+        """Return implementation for given type.
+
+        :param cls: Type of the first argument.
+        :returns: Implementation registered for the type or its closest ancestor.
+        """
+        nonlocal cache_token
+        if cache_token != get_cache_token():
+            # an abstract base class got a new virtual subclass => resolve all types again
+            impls.clear()
+            cache_token = get_cache_token()
+
+        try:
+            return impls[cls]
+        except KeyError:
+            impl = impls[cls] = dispatcher.dispatch(cls)
+            return impl
+
+    def register(cls: Any, func: Callable[..., Any] | None = None) -> Callable[..., Any]:
+        """Register implementation for given type, see `functools.singledispatch`."""
+        impls.clear()
+        return dispatcher.register(cls, func)
+
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if not args:
+            raise TypeError(f"{funcname} requires at least 1 positional argument")
+
+        # fast path inlined from `dispatch`
+        cls = args[0].__class__
+        impl = impls.get(cls) if cache_token == get_cache_token() else None
+        if impl is None:
+            impl = dispatch(cls)
+
+        return impl(*args, **kwargs)
+
+    funcname = getattr(func, "__name__", "typedispatch function")
+    wrapper.register = register  # type: ignore
+    wrapper.dispatch = dispatch  # type: ignore
+    wrapper.registry = dispatcher.registry  # type: ignore
+    update_wrapper(wrapper, func)
+
+    return wrapper
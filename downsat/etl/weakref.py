@@ -25,17 +25,21 @@ class WeakIdKeyDictionary(Generic[types.KeyType, types.ValueType]):
     items, update etc.
     """
 
+    __slots__ = ("data", "_finalizers")
+
     def __init__(self) -> None:
         """Initialize dictionary."""
         self.data: dict[int, Any] = dict()
+        self._finalizers: dict[int, finalize] = dict()  # finalizers removing the records of tracked objects
 
     def _weak_delitem(self, key_id: int) -> None:
         """Delete item, do not raise KeyError if the key does not exist.
 
         :param key: Object whose record should be deleted.
         """
+        self._finalizers.pop(key_id, None)
         try:
-            self.data.__delitem__(key_id)
+            del self.data[key_id]
         except KeyError:
             pass
 
@@ -46,16 +50,12 @@ class WeakIdKeyDictionary(Generic[types.KeyType, types.ValueType]):
         :param value: Value to store.
         """
         obj_id = id(key)
-        finalize_fun = None
-        try:
-            if obj_id not in self.data:
-                finalize_fun = finalize(key, self._weak_delitem, obj_id)
-            self.data.__setitem__(obj_id, value)
-        except Exception:
-            # something broke, deactivate finalize_fun and remove the item
-            if finalize_fun:
-                finalize_fun()
-            raise
+        data = self.data
+        if obj_id not in data:
+            # not yet tracked => remove the record once the object is garbage collected
+            # Note: finalize raises TypeError for objects that cannot be weakly referenced before anything is stored
+            self._finalizers[obj_id] = finalize(key, self._weak_delitem, obj_id)
+        data[obj_id] = value
 
     def __getitem__(self, key: types.KeyType) -> types.ValueType:
         """Getitem that queries by object id.
@@ -65,22 +65,21 @@ class WeakIdKeyDictionary(Generic[types.KeyType, types.ValueType]):
         :returns: Value stored for that object.
         :raises KeyError: Object id not found.
         """
-        obj_id = id(key)
         try:
-            return self.data.__getitem__(obj_id)
+            return self.data[id(key)]
         except KeyError as e:
             raise KeyError(f"{key}") from e
 
     def __delitem__(self, key: types.KeyType) -> None:
         obj_id = id(key)
-        self.data.__delitem__(obj_id)
+        del self.data[obj_id]
+        self._finalizers.pop(obj_id).detach()
 
     def __contains__(self, key: Type) -> bool:
-        obj_id = id(key)
-        return self.data.__contains__(obj_id)
+        return id(key) in self.data
 
     def __len__(self) -> int:
-        return self.data.__len__()
+        return len(self.data)
 
     def values(self) -> ValuesView:
         """Return stored values."""
@@ -95,11 +94,32 @@ class WeakIdKeyDictionary(Generic[types.KeyType, types.ValueType]):
         """
         obj_id = id(key)
         if obj_id in self.data:
-            return self[key]
+            return self.data[obj_id]
         else:
             self[key] = default
             return default
 
+    def pop(self, key: types.KeyType, default: types.ValueType | None = None) -> types.ValueType:
+        """Remove key from the dictionary and return its value.
+
+        :param key: Key.
+        :param default: Default value.
+        :returns: self[key] if key in self else default
+        """
+        obj_id = id(key)
+        if obj_id not in self.data:
+            return default
+
+        self._finalizers.pop(obj_id).detach()
+        return self.data.pop(obj_id)
+
+    def clear(self) -> None:
+        """Remove all items from the dictionary."""
+        for finalizer in self._finalizers.values():
+            finalizer.detach()
+        self._finalizers.clear()
+        self.data.clear()
+
     def get(self, key: types.KeyType, default: types.ValueType | None = None) -> types.ValueType:
         """Get value from dict or default value.
 
@@ -107,8 +127,7 @@ class WeakIdKeyDictionary(Generic[types.KeyType, types.ValueType]):
         :param default: Default value.
         :returns: self[key] if key in self else default
         """
-        obj_id = id(key)
-        return self.data.get(obj_id, default)
+        return self.data.get(id(key), default)
 
 
 class Path(pathlib.Path):
@@ -117,6 +136,9 @@ class Path(pathlib.Path):
     _flavour = type(pathlib.Path())._flavour  # type: ignore
 
 
+# Note: instances of builtin list, dict and str can neither be weakly referenced nor store attributes
+#       => metadata cannot be attached to them at all, neither locally nor in WeakIdKeyDictionary,
+#       the subclasses below are needed to carry metadata.
 class List(typing.List[types.ItemType], Generic[types.ItemType]):
     """List with weakref."""  # TODO: copy list docstring
 
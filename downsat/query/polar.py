@@ -1,15 +1,18 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Callable, Protocol, Sequence, TypeVar, overload
+from typing import TYPE_CHECKING, Callable, Iterator, Protocol, Sequence, Tuple, TypeVar, overload
 import datetime
+from functools import lru_cache, partial
 
 import numpy as np
+from pyorbital import tlefile
 from pyorbital.orbital import Orbital
 
 from downsat.core.models import LonLat
 from downsat.core.utils import TimeSlotType, parse_time
 from downsat.data_sources.satellite_info import SatelliteInfo, satellite_info_leo
 from downsat.etl import protocols
+from downsat.etl.context import RunContext
 
 
 if TYPE_CHECKING:
@@ -27,6 +30,56 @@ if TYPE_CHECKING:
         ...
 
 
+def _get_orbital(
+    satellite: str,
+    date: datetime.date,
+    max_tle_age: int,
+    tle_archive: Callable[[int | str], protocols.DataSource],
+) -> Orbital:
+    """Build orbit model of a satellite from the latest non-empty TLE file not newer than given date.
+
+    :param satellite: Satellite name.
+    :param date: Date of the newest TLE file to be considered.
+    :param max_tle_age: Maximum age in days of TLE data to consider.
+    :param tle_archive: Partially initialized TLE archive, see `find_visible_polar_passes`.
+    :return: Orbit model.
+    :raises ValueError: No valid TLE file found.
+    """
+    daily_tle_archive = tle_archive(satellite)
+    for _ in range(max_tle_age):  # max `max_tle_age` days old TLE
+        tle_file = daily_tle_archive[date]  # type: ignore  # TODO: fix
+        if len(tle_file) > 0 and tle_file[0].stat().st_size > 0:
+            # found TLE with non-zero size
+            break
+        date -= datetime.timedelta(days=1)
+    else:
+        # no valid TLE file found after searching through the max_tle_age range
+        raise ValueError(
+            f"No valid TLE file found for satellite `{satellite}` within the last {max_tle_age} days."
+        )
+
+    tle = tlefile.read(satellite, tle_file=str(tle_file[0]))
+    return _build_orbital(satellite, tle.line1, tle.line2)
+
+
+@lru_cache(maxsize=256)
+def _build_orbital(satellite: str, line1: str, line2: str) -> Orbital:
+    """Build orbit model of a satellite from its TLE.
+
+    The same TLE is typically used for many queries => the orbit models are cached by the TLE itself.
+
+    :param satellite: Satellite name.
+    :param line1: First line of the TLE.
+    :param line2: Second line of the TLE.
+    :return: Orbit model.
+    """
+    return Orbital(satellite, line1=line1, line2=line2)
+
+
+# (time interval, window start, window length in hours, date of the newest TLE), see `_resolve_window`
+_Window = Tuple[slice, "Arrow", int, datetime.date]
+
+
 @overload
 def find_visible_polar_passes(
     coords: LonLat,
@@ -38,6 +91,7 @@ def find_visible_polar_passes(
     horizon: float | dict[str, float] | None = None,
     altitude: float = 0,
     max_tle_age: int = 14,
+    num_workers: int | None = None,
 ) -> tuple["Arrow", ...]:
     """Find times when a point at surface is visible by a specific polar satellite."""
 
@@ -53,6 +107,7 @@ def find_visible_polar_passes(
     horizon: float | dict[str, float] | None = None,
     altitude: float = 0,
     max_tle_age: int = 14,
+    num_workers: int | None = None,
 ) -> dict[str, tuple["Arrow", ...]]:
     """Find times when a point at surface is visible by multiple polar satellites."""
 
@@ -67,6 +122,7 @@ def find_visible_polar_passes(
     horizon: float | dict[str, float] | None = None,
     altitude: float = 0,
     max_tle_age: int = 14,
+    num_workers: int | None = None,
 ) -> tuple["Arrow", ...] | dict[str, tuple["Arrow", ...]]:
     """Calculate the moments when a specific ground point is observable by one or more polar satellites at their maximum elevation.
 
@@ -84,6 +140,8 @@ def find_visible_polar_passes(
         If not found, a ValueError is raised. Can also be a dictionary mapping satellite names to horizon angles.
     :parm altitutde: Altitude of the ground point of interest in meters. Default is 0 (sea level).
     :param max_tle_age: Maximum age in days of TLE data to consider. Default is 14 days.
+    :param num_workers: Number of parallel threads used when multiple satellites are processed.
+        Satellites are processed serially if None (default) or 1.
     :return: Tuple of times when the satellite at its maximum elevation can observe the ground point. Each time corrsponds to
         one satellite orbit. If multiple satellites are queried, the result is a dictionary mapping satellite names to tuples of
         observation times. If the satellite is not visible at all, an empty tuple is returned.
@@ -94,22 +152,71 @@ def find_visible_polar_passes(
         # get all known satellites
         satellite = satellite_info_archive.keys()
 
-    if not isinstance(satellite, str):
-        return {
-            sat: find_visible_polar_passes(
-                coords=coords,
-                time=time,
-                tle_archive=tle_archive,
-                satellite=sat,
-                satellite_info_archive=satellite_info_archive,
-                dt=dt,
-                horizon=horizon,
-                altitude=altitude,
-                max_tle_age=max_tle_age,
-            )
-            for sat in satellite
-        }
+    # satellite independent => resolve only once
+    window = _resolve_window(time, dt)
+
+    if isinstance(satellite, str):
+        horizon = _resolve_horizon(satellite, horizon, satellite_info_archive)
+        return tuple(_iter_passes(coords, window, tle_archive, satellite, horizon, altitude, max_tle_age))
+
+    satellites = tuple(satellite)
+    horizons = {sat: _resolve_horizon(sat, horizon, satellite_info_archive) for sat in satellites}
+    # Note: threads share the cached orbit models and need not pickle tle_archive (incl. credentials)
+    passes = RunContext(num_workers=num_workers, backend="threading").map(
+        partial(_find_passes, coords, window, tle_archive, horizons, altitude, max_tle_age),
+        satellites,
+    )
+    return dict(zip(satellites, passes))
+
+
+def iter_visible_polar_passes(
+    coords: LonLat,
+    time: TimeSlotType,
+    tle_archive: Callable[[int | str], protocols.DataSource],
+    satellite: str,
+    satellite_info_archive: SatelliteInfo = satellite_info_leo,
+    dt: datetime.timedelta | None = None,
+    horizon: float | dict[str, float] | None = None,
+    altitude: float = 0,
+    max_tle_age: int = 14,
+) -> Iterator["Arrow"]:
+    """Lazily iterate over the moments when a ground point is observable by a polar satellite at its maximum elevation.
+
+    Lazy variant of `find_visible_polar_passes` for a single satellite. Nothing is computed until the first
+    pass is requested, so the TLE data are not loaded at all if the iterator is never consumed.
 
+    :param coords: Geographic coordinates of the ground point of interest.
+    :param time: Specific time or time interval of interest, see `find_visible_polar_passes`.
+    :param tle_archive: Partially initialized TLE archive, see `find_visible_polar_passes`.
+    :param satellite: Satellite name.
+    :param satellite_info_archive: Partially initialized satellite info archive, see `find_visible_polar_passes`.
+    :param dt: Halfwidth of the time interval, see `find_visible_polar_passes`.
+    :param horizon: Minimum elevation (in degrees), see `find_visible_polar_passes`.
+    :param altitude: Altitude of the ground point of interest in meters. Default is 0 (sea level).
+    :param max_tle_age: Maximum age in days of TLE data to consider. Default is 14 days.
+    :return: Iterator over times when the satellite at its maximum elevation can observe the ground point in
+        chronological order.
+    :raises ValueError: If `time` and `dt` are inconsistent (raised on first iteration).
+    :raises ValueError: If `horizon` is not specified and the satellite is not in the `satelite_info_archive`
+        (raised on first iteration).
+    """
+    window = _resolve_window(time, dt)
+    horizon = _resolve_horizon(satellite, horizon, satellite_info_archive)
+    yield from _iter_passes(coords, window, tle_archive, satellite, horizon, altitude, max_tle_age)
+
+
+def _resolve_horizon(
+    satellite: str, horizon: float | dict[str, float] | None, satellite_info_archive: SatelliteInfo
+) -> float:
+    """Get minimum elevation of a satellite above the horizon.
+
+    :param satellite: Satellite name.
+    :param horizon: Horizon angle, dictionary mapping satellite names to horizon angles or None,
+        see `find_visible_polar_passes`.
+    :param satellite_info_archive: Satellite info archive used if the horizon is not given.
+    :return: Horizon angle in degrees.
+    :raises ValueError: If `horizon` is not specified and the satellite is not in the `satelite_info_archive`.
+    """
     if isinstance(horizon, dict):
         horizon = horizon.get(satellite)
 
@@ -129,6 +236,18 @@ def find_visible_polar_passes(
                 "The horizon parameter must be specified. {satellite} does not seem to be a polar satellite - cannot find its swath angle."
             )
 
+    return horizon  # type: ignore
+
+
+def _resolve_window(time: TimeSlotType, dt: datetime.timedelta | None) -> _Window:
+    """Get time interval given by the user and the search window covering it.
+
+    :param time: Specific time or time interval, see `find_visible_polar_passes`.
+    :param dt: Halfwidth of the time interval, see `find_visible_polar_passes`.
+    :return: Time interval, start of the search window, length of the window in hours and date of the
+        newest TLE file to be considered.
+    :raises ValueError: If `time` and `dt` are inconsistent.
+    """
     # construct time interval given by the user
     if dt is None:
         time_interval = parse_time(time, interval=True)
@@ -151,21 +270,36 @@ def find_visible_polar_passes(
     window_start = time_interval.start + dt - datetime.timedelta(hours=window_hours)
     date = time_interval.stop.date()
 
+    return time_interval, window_start, window_hours, date
+
+
+def _iter_passes(
+    coords: LonLat,
+    window: _Window,
+    tle_archive: Callable[[int | str], protocols.DataSource],
+    satellite: str,
+    horizon: float,
+    altitude: float,
+    max_tle_age: int,
+) -> Iterator["Arrow"]:
+    """Iterate over times of maximum elevation of a satellite passing over a ground point.
+
+    :param coords: Geographic coordinates of the ground point of interest.
+    :param window: Time interval and search window, see `_resolve_window`.
+    :param tle_archive: Partially initialized TLE archive, see `find_visible_polar_passes`.
+    :param satellite: Satellite name.
+    :param horizon: Minimum elevation in degrees.
+    :param altitude: Altitude of the ground point in meters.
+    :param max_tle_age: Maximum age in days of TLE data to consider.
+    :return: Iterator over times of maximum elevation within the time interval.
+    """
+    time_interval, window_start, window_hours, date = window
+
     # find satellite passes
-    daily_tle_archive = tle_archive(satellite)
-    for _ in range(max_tle_age):  # max `max_tle_age` days old TLE
-        tle_file = daily_tle_archive[date]  # type: ignore  # TODO: fix
-        if len(tle_file) > 0 and tle_file[0].stat().st_size > 0:
-            # found TLE with non-zero size
-            break
-        date -= datetime.timedelta(days=1)
-    else:
-        # no valid TLE file found after searching through the max_tle_age range
-        raise ValueError(
-            f"No valid TLE file found for satellite `{satellite}` within the last {max_tle_age} days."
-        )
+    orb = _get_orbital(satellite, date, max_tle_age, tle_archive)
 
-    orb = Orbital(satellite, tle_file=str(tle_file[0]))
+    # Note: pyorbital evaluates elevations on a minute grid in a single vectorized call and refines only
+    #       the crossings and maxima found => no need for custom vectorized propagation
     pass_times = orb.get_next_passes(
         utc_time=window_start,
         length=window_hours,
@@ -181,8 +315,27 @@ def find_visible_polar_passes(
     # and only those that fall into the user-defined time interval
 
     # TODO: keep tle metadata
+    start, stop = time_interval.start, time_interval.stop
+    for _, _, max_elevation_time in pass_times:
+        if start <= max_elevation_time <= stop:
+            yield max_elevation_time
+
+
+def _find_passes(
+    coords: LonLat,
+    window: _Window,
+    tle_archive: Callable[[int | str], protocols.DataSource],
+    horizons: dict[str, float],
+    altitude: float,
+    max_tle_age: int,
+    satellite: str,
+) -> tuple["Arrow", ...]:
+    """Find times of maximum elevation of one of multiple satellites, see `_iter_passes`.
+
+    :param horizons: Mapping of satellite names to minimum elevations in degrees.
+    :param satellite: Satellite name, the last argument such that the function can be mapped over satellites.
+    :return: Times of maximum elevation within the time interval.
+    """
     return tuple(
-        pass_time[2]
-        for pass_time in pass_times
-        if pass_time[2] >= time_interval.start and pass_time[2] <= time_interval.stop
+        _iter_passes(coords, window, tle_archive, satellite, horizons[satellite], altitude, max_tle_age)
     )
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 import datetime
-import time
 
 import pytest
 from pytest_cases import fixture, fixture_union
@@ -16,23 +15,6 @@ if TYPE_CHECKING:
     from downsat.core.utils import TimeSlotType
 
 
-@fixture
-def eumdac_key() -> "EumdacKey":
-    from downsat.clients.eumdac import EumdacKey
-
-    try:
-        return EumdacKey.from_env()
-    except KeyError as e:
-        pytest.skip(f"Eumdac credentials not found in env variable. {e}.")
-
-
-@fixture
-def eumdac_user(eumdac_key: "EumdacKey") -> "EumdacUser":
-    from downsat.clients.eumdac import EumdacUser
-
-    return EumdacUser(name="John Smith", key=eumdac_key, description="John Smith's eumdac key")
-
-
 @fixture
 def valid_msg_datetime_range() -> slice:
     return slice(datetime.datetime(2022, 11, 4, 8, 0), datetime.datetime(2022, 11, 4, 8, 25))
@@ -78,6 +60,7 @@ def test_eumdac_user(eumdac_user: "EumdacUser") -> None:
     assert eumdac_user.credentials == eumdac_user.key.credentials
 
 
+@pytest.mark.network
 def test_invalid_eumdac_key() -> None:
     """EumdacClient validates during init that the given eumdac credentials are valid."""
     from downsat.clients.eumdac import EumdacKey
@@ -154,36 +137,43 @@ def test_collection_name_alias(eumdac_key: "EumdacKey") -> None:
     )
 
 
-def test_eumdac_collection_parallel_download(
-    eumdac_key: "EumdacKey",
-) -> None:
-    from downsat.clients.eumdac import EumdacCollection
+def test_eumdac_collection_parallel_download(monkeypatch: pytest.MonkeyPatch) -> None:
+    from io import BytesIO
+    import threading
+
+    from downsat.clients.eumdac import EumdacCollection, EumdacCredentials
     from downsat.etl.context import setcontext
 
-    time_range = (datetime.datetime(2022, 11, 4, 8, 0), datetime.datetime(2022, 11, 4, 8, 35))
+    class DummyCredentials(EumdacCredentials):
+        credentials = ("key", "secret")
+        token = None
 
-    # time 1 cpu
-    collection_1 = EumdacCollection("MSG", eumdac_key)
-    setcontext(num_workers=1)(collection_1)
-    ids = collection_1.query(dtstart=time_range[0], dtend=time_range[1])
+    ids = ("id1", "id2", "id3")
 
-    assert len(ids) == 3
+    # downloads return only once all of them are running at the same time
+    barrier = threading.Barrier(len(ids), timeout=1)
 
-    start_time_1 = time.time()
-    collection_1[ids]  # type: ignore  # TODO: ensure EumdacCollection is instance of protocols.MultiKeyQueryDataSource
-    time_1_cpu = time.time() - start_time_1
+    def load_data_by_id(self: EumdacCollection, item: str) -> BytesIO:  # noqa: U100
+        barrier.wait()
+        return BytesIO(item.encode())
 
-    # time n cpu
-    collection_n = EumdacCollection("MSG", eumdac_key)
-    setcontext(num_workers=len(ids))(collection_n)
+    monkeypatch.setattr(EumdacCollection, "_load_data_by_id", load_data_by_id)
 
-    start_time_n = time.time()
-    collection_n[ids]  # type: ignore  # TODO: ensure EumdacCollection is instance of protocols.MultiKeyQueryDataSource
-    time_num_workers = time.time() - start_time_n
+    # downloads run in parallel
+    collection_n = EumdacCollection("MSG", DummyCredentials())
+    setcontext(num_workers=len(ids))(collection_n)
+    buffers = collection_n[ids]  # type: ignore  # TODO: ensure EumdacCollection is instance of protocols.MultiKeyQueryDataSource
+    assert [buffer.read() for buffer in buffers] == [b"id1", b"id2", b"id3"]
 
-    assert time_num_workers < time_1_cpu
+    # serial download never lets all the downloads meet
+    barrier.reset()
+    collection_1 = EumdacCollection("MSG", DummyCredentials())
+    setcontext(num_workers=1)(collection_1)
+    with pytest.raises(threading.BrokenBarrierError):
+        collection_1[ids]  # type: ignore  # TODO: ensure EumdacCollection is instance of protocols.MultiKeyQueryDataSource
 
 
+@pytest.mark.network
 def test_invalid_eumdac_key_from_env() -> None:
     from downsat.clients.eumdac import EumdacKey
 
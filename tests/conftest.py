@@ -1,28 +1,38 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Generator
+from typing import TYPE_CHECKING, Any
 import datetime
+import os
 from pathlib import Path
-import tempfile
 
 from _pytest.fixtures import SubRequest
-from pyresample import AreaDefinition
 import pytest
 from pytest_cases import fixture, fixture_union, param_fixture
 
-from downsat.core.models import LonLat
-
 
 if TYPE_CHECKING:
     from trollimage.xrimage import XRImage
 
     from downsat.clients.eumdac import EumdacCollection, EumdacKey, EumdacUser, TimeSlotType
     from downsat.clients.spacetrack import SpaceTrackKey
+    from downsat.core.platform import Platform
     from downsat.etl import protocols
 
 
+# --- markers
+# tests using these fixtures download data => marked as network tests automatically
+_NETWORK_FIXTURES = {"eumdac_key", "spacetrack_key"}
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    for item in items:
+        if _NETWORK_FIXTURES.intersection(getattr(item, "fixturenames", ())):
+            item.add_marker(pytest.mark.network)
+
+
 # --- eumdac
-@fixture
+# session scope => the access token is requested and validated only once
+@fixture(scope="session")
 def eumdac_key() -> "EumdacKey":
     from downsat.clients.eumdac import EumdacKey
 
@@ -32,7 +42,7 @@ def eumdac_key() -> "EumdacKey":
         pytest.skip(f"Eumdac credentials not found in env variable {e}.")
 
 
-@fixture
+@fixture(scope="session")
 def eumdac_user(eumdac_key: "EumdacKey") -> "EumdacUser":
     from downsat.clients.eumdac import EumdacUser
 
@@ -72,14 +82,23 @@ def eumdac_collection_and_time(
 
 
 # --- Metop data
-valid_metop_geo = param_fixture(
-    "valid_metop_geo",
-    [
-        {"area": "germ"},
-        {"point": LonLat(lon=14.46, lat=50.0)},
-        {},
-        {"geo": "POINT(14.46 50.0)"},
-        {
+@fixture(params=["str_area", "point", "none", "geo_point", "area_def"])
+def valid_metop_geo(request: "SubRequest") -> dict[str, Any]:
+    # heavy imports only when the fixture is used, not during collection
+    from pyresample import AreaDefinition
+
+    from downsat.core.models import LonLat
+
+    if request.param == "str_area":
+        return {"area": "germ"}
+    elif request.param == "point":
+        return {"point": LonLat(lon=14.46, lat=50.0)}
+    elif request.param == "none":
+        return {}
+    elif request.param == "geo_point":
+        return {"geo": "POINT(14.46 50.0)"}
+    else:
+        return {
             "area": AreaDefinition(
                 "test_area",
                 "",
@@ -100,10 +119,7 @@ valid_metop_geo = param_fixture(
                 425,
                 (-155100, -4441495, 868899, -3417495),
             )
-        },
-    ],
-    ids=["str_area", "point", "none", "geo_point", "area_def"],
-)
+        }
 
 
 valid_metop_datetime = param_fixture(
@@ -140,28 +156,68 @@ def spacetrack_satellite_name() -> str:
 
 spacetrack_object_id = fixture_union("spacetrack_object_id", [norad_cat_id, spacetrack_satellite_name])
 
+# -- platform
+
+
+@pytest.fixture(scope="session")
+def platform_from_env() -> "Platform":
+    """Platform built from the default configuration, shared by tests that do not modify it."""
+    from downsat import Platform
+
+    return Platform.from_env()
+
+
+@pytest.fixture(scope="session", params=["MSG", "RSS", "Metop"])
+def satellite_class(request: "SubRequest") -> Any:
+    """EUMETSAT archive factory exported by downsat (MSG, RSS or Metop)."""
+    import downsat
+
+    return getattr(downsat, request.param)
+
+
 # -- global archives
 
 
+def _shared_archive_path(tmp_path_factory: pytest.TempPathFactory, name: str) -> Path:
+    """Path to an archive shared by all tests of the session.
+
+    When running in parallel with pytest-xdist, the archive is shared by all workers => data downloaded by one
+    worker are reused by the others. Concurrent writes of the same item are serialized by the locks of the
+    archive's file storage.
+
+    :param tmp_path_factory: Pytest factory of temporary directories.
+    :param name: Name of the archive.
+    :return: Path to the (not yet existing) archive directory.
+    """
+    if "PYTEST_XDIST_WORKER" in os.environ:
+        # base temporary directories of xdist workers share the same parent directory
+        return tmp_path_factory.getbasetemp().parent / "archives" / name
+
+    return tmp_path_factory.mktemp("archives") / name
+
+
 @pytest.fixture(scope="session")
-def msg_archive_path() -> Generator[Path, None, None]:
+def msg_archive_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Global MSG archive for tests that do not need to repeatedly download data."""
-    with tempfile.TemporaryDirectory() as temp_dir_path:
-        yield Path(temp_dir_path) / "MSG"
+    return _shared_archive_path(tmp_path_factory, "MSG")
 
 
 @pytest.fixture(scope="session")
-def metop_archive_path() -> Generator[Path, None, None]:
+def metop_archive_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Global METOP archive for tests that do not need to repeatedly download data."""
-    with tempfile.TemporaryDirectory() as temp_dir_path:
-        yield Path(temp_dir_path) / "METOP"
+    return _shared_archive_path(tmp_path_factory, "METOP")
 
 
 @pytest.fixture(scope="session")
-def rss_archive_path() -> Generator[Path, None, None]:
+def rss_archive_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Global RSS archive for tests that do not need to repeatedly download data."""
-    with tempfile.TemporaryDirectory() as temp_dir_path:
-        yield Path(temp_dir_path) / "RSS"
+    return _shared_archive_path(tmp_path_factory, "RSS")
+
+
+@pytest.fixture(scope="session")
+def tle_archive_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Global TLE archive for tests that do not need to repeatedly download data."""
+    return _shared_archive_path(tmp_path_factory, "TLE")
 
 
 @pytest.fixture
@@ -207,9 +263,10 @@ def random_xrimage() -> "XRImage":
 
 @pytest.fixture
 def is_satpy_available() -> bool:
-    try:
-        pass
-    except ImportError:
+    from importlib.util import find_spec
+
+    # find_spec does not import satpy => cheap, and cannot be removed as an unused import by autoflake
+    if find_spec("satpy") is None:
         pytest.skip("Satpy is not available.")
 
     return True
@@ -19,8 +19,8 @@ def file_locked_disk_cache(tmp_path: Path) -> "LockableCache":
 def test_lockable_cache(file_locked_disk_cache: "LockableCache") -> None:
     """Test LockableCache works."""
 
+    from concurrent.futures import ThreadPoolExecutor
     from multiprocessing import Process
-    from threading import Thread
 
     cache = file_locked_disk_cache
     cache["key"] = "value"
@@ -36,13 +36,9 @@ def test_lockable_cache(file_locked_disk_cache: "LockableCache") -> None:
         cache["key"] = "value2"
         assert cache["key"] == "value2"
 
-    threads = []
-    for _ in range(10):
-        thread = Thread(target=worker_func, args=(cache,))
-        thread.start()
-        threads.append(thread)
-    for thread in threads:
-        thread.join()
+    # Note: unlike with bare threads, exceptions raised by the workers are propagated by `map`
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        list(executor.map(worker_func, [cache] * 10))
     assert cache["key"] == "value2"
 
     # test that it works in multiprocessing environment
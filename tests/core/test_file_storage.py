@@ -109,23 +109,24 @@ def test_file_dataset(file_content: Any, tmp_path: Path, filename_pattern: str |
     with pytest.raises(KeyError):
         storage["non-existing"]
 
+    item_metadata = getmeta(item)
+
     # getitem preserves metadata stored in the filename / dirname
     if filename_pattern is not None:
-        recovered_metadata = getmeta(item)
         for metakey in ["random", "name"]:
             if f"{{{metakey}}}" in filename_pattern:
-                assert recovered_metadata[metakey] == metadata[metakey]
+                assert item_metadata[metakey] == metadata[metakey]
 
     # getitem preserves all metadata
-    item_metadata = getmeta(item)
     assert item_metadata == metadata
 
     # getitem preserves metadata of dict values
+    file_content_metadata = getmeta(file_content)
     for path in item:
         if isinstance(file_content, dict):
             assert getmeta(path) == getmeta(file_content[path.name])
         else:
-            assert getmeta(path) == getmeta(file_content)
+            assert getmeta(path) == file_content_metadata
 
     # multi-key getitem works
     multi_items = storage[key, key]  # type: ignore  # TODO: ensure FileDataset is instance of protocols.MultiKeyQueryDataSource
@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import threading
 import time
@@ -32,6 +33,13 @@ def filelock_rlock(tmp_path: Path) -> "FileRLock":
 lock = fixture_union("lock", [diskcache_rlock, filelock_rlock], ids=["diskcache", "filelock"])
 
 
+@pytest.fixture(scope="module")
+def thread_pool() -> Iterator[ThreadPoolExecutor]:
+    """Worker threads shared by the tests of this module."""
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        yield executor
+
+
 def test_call_method(lock: "LockBase") -> None:
     new_key = "__new_lock__"
     new_lock = lock(new_key)
@@ -44,20 +52,32 @@ def test_context_manager(lock: "LockBase") -> None:
         pass
 
 
-def test_lock(lock: "LockBase") -> None:
-    def worker() -> None:
+def test_lock(lock: "LockBase", thread_pool: ThreadPoolExecutor) -> None:
+    trace = []
+    first_entered = threading.Event()
+    second_started = threading.Event()
+
+    def first_worker() -> None:
+        with lock:
+            trace.append("first enter")
+            first_entered.set()
+            second_started.wait(timeout=10)
+            time.sleep(0.05)  # let the second worker reach the lock
+            trace.append("first exit")
+
+    def second_worker() -> None:
+        first_entered.wait(timeout=10)
+        second_started.set()
         with lock:
-            time.sleep(1)
-
-    threads = [threading.Thread(target=worker) for _ in range(2)]
-    start_time = time.time()
-    for thread in threads:
-        thread.start()
-    for thread in threads:
-        thread.join()
-    end_time = time.time()
-    # Ensure the total time is at least double the sleep time of each worker, indicating sequential execution.
-    assert end_time - start_time >= 2
+            trace.append("second enter")
+            trace.append("second exit")
+
+    futures = [thread_pool.submit(first_worker), thread_pool.submit(second_worker)]
+    for future in futures:
+        # unlike with bare threads, exceptions raised by the workers are propagated
+        future.result()
+    # the second worker can enter only after the first one left
+    assert trace == ["first enter", "first exit", "second enter", "second exit"]
 
 
 def test_reentrant_lock(lock: "LockBase") -> None:
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any
 from pathlib import Path
 
 import pytest
 
 
+if TYPE_CHECKING:
+    from downsat import Platform
+
+
 @pytest.mark.parametrize(
     "default_parameters", [set(), {"a", "b"}], ids=["no_default_parameters", "with_default_parameters"]
 )
@@ -58,6 +63,7 @@ def test_loading_env_parameters() -> None:
     assert platform["platform.test"] == "1"
 
 
+@pytest.mark.network
 def test_from_env() -> None:
     """Test that Platform can be initialized from configuration files."""
 
@@ -73,11 +79,12 @@ def test_from_env() -> None:
     platform.get(EumdacKey)
 
 
-def test_class_with_subclasses() -> None:
+@pytest.mark.network
+def test_class_with_subclasses(platform_from_env: "Platform") -> None:
     """That that Platform can create classes whose attributes are classes themselves."""
-    from downsat import EumdacKey, EumdacUser, Platform
+    from downsat import EumdacKey, EumdacUser
 
-    platform = Platform.from_env()
+    platform = platform_from_env
 
     # platform can load EumdacUser
     platform.get("EumdacUser")
@@ -86,23 +93,16 @@ def test_class_with_subclasses() -> None:
     assert isinstance(user.key, EumdacKey)
 
 
-@pytest.mark.parametrize("satellite", ["MSG", "RSS", "Metop"], ids=["MSG", "RSS", "Metop"])
-def test_eumetsat_archives(tmp_path: Path, satellite: str) -> None:
+@pytest.mark.network
+def test_eumetsat_archives(tmp_path: Path, satellite_class: Any, platform_from_env: "Platform") -> None:
     """Test that Platfrom can instantiate MSG, RSS and Metop classes."""
-    import importlib
     import os
 
-    from downsat import Platform
-
-    # dynamically import the archive class/function
-    module = importlib.import_module("downsat")
-    satellite_object = getattr(module, satellite)
-
-    platform = Platform.from_env()
+    platform = platform_from_env
 
     # platform can provide satellite object when data_path is provided as parameter
-    platform.get(satellite_object, {"data_path": tmp_path})  # type: ignore  # TODO: fix
+    platform.get(satellite_class, {"data_path": tmp_path})
 
     # platform can provide satellite object when data_path provided in environment variable
-    os.environ[f"DOWNSAT_{satellite.upper()}_PATH"] = str(tmp_path)
-    platform.get(satellite.upper())  # TODO: move upper to platform so that it is not needed here
+    os.environ[f"DOWNSAT_{satellite_class.name}_PATH"] = str(tmp_path)
+    platform.get(satellite_class.name)
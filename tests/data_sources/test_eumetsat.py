@@ -1,25 +1,23 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, TypedDict
+from typing import TYPE_CHECKING, Any, Iterator, TypedDict
+from contextlib import ExitStack
 import datetime
 from io import BytesIO
 from pathlib import Path, PosixPath
-import time
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 from zipfile import ZipFile
 
 import arrow
 from pyresample import AreaDefinition
 import pytest
 from pytest import fixture
-from pytest_cases import fixture_union
 
 from downsat import LonLat
 
 
 if TYPE_CHECKING:
     from downsat import EumdacKey
-    from downsat.etl import protocols
 
 
 @fixture
@@ -32,52 +30,72 @@ def valid_msg_datetime_range() -> str:
     return "2021110113"
 
 
-@fixture
-def metop_datasource_and_slot(
-    metop_archive: "protocols.MultiKeyDataSource",
-) -> tuple["protocols.MultiKeyDataSource", str]:
-    return metop_archive, "202201011130"
+@fixture(scope="session")
+def sample_eumdac_zip() -> bytes:
+    """Content of a sample zip file as returned by eumdac client."""
+    zip_io = BytesIO()
+    with ZipFile(zip_io, "w") as zip_file:
+        zip_file.writestr("some_file", b"some_data")
+    return zip_io.getvalue()
 
 
 @fixture
-def msg_datasource_and_slot(
-    msg_archive: "protocols.MultiKeyDataSource",
-) -> tuple["protocols.MultiKeyDataSource", str]:
-    return msg_archive, "202211011530"
+def eumdac_mocks(sample_eumdac_zip: bytes) -> Iterator[tuple[MagicMock, MagicMock]]:
+    """Mock query and _load_data_by_id methods of EumdacCollection not to actually download the data.
 
+    The query finds single product `some_file` and loading any product returns the sample zip file.
+    """
+    from downsat.etl.metadata import setmeta
 
-@fixture
-def rss_datasource_and_slot(
-    rss_archive: "protocols.MultiKeyDataSource",
-) -> tuple["protocols.MultiKeyDataSource", str]:
-    return rss_archive, "202211011530"
+    def load_data_by_id(self: Any, item: str) -> BytesIO:  # noqa: U100
+        # fresh buffer => the read position is not shared between calls
+        zip_io = BytesIO(sample_eumdac_zip)
+        setmeta(zip_io, name=item)
+        return zip_io
+
+    with ExitStack() as stack:
+        mock_query = stack.enter_context(
+            patch("downsat.clients.eumdac.EumdacCollection.query", autospec=True, return_value=("some_file",))
+        )
+        mock_load_data = stack.enter_context(
+            patch(
+                "downsat.clients.eumdac.EumdacCollection._load_data_by_id",
+                autospec=True,
+                side_effect=load_data_by_id,
+            )
+        )
+        yield mock_query, mock_load_data
 
 
-fixture_union(
-    "eumdac_datasource_and_slot",
-    [msg_datasource_and_slot, rss_datasource_and_slot, metop_datasource_and_slot],
+@pytest.mark.parametrize(
+    "satellite, time_slot",
+    [("MSG", "202211011530"), ("RSS", "202211011530"), ("Metop", "202201011130")],
     ids=["msg", "rss", "metop"],
-    unpack_into="eumdac_datasource, eumdac_datasource_test_date",
 )
+def test_eumdac_caching(
+    tmp_path: Path, satellite: str, time_slot: str, eumdac_mocks: tuple[MagicMock, MagicMock]
+) -> None:
+    import importlib
+
+    from downsat.clients.eumdac import EumdacCredentials
 
+    class DummyCredentials(EumdacCredentials):
+        credentials = ("key", "secret")
+        token = None
 
-@pytest.mark.order(0)
-def test_eumdac_caching(eumdac_datasource: "protocols.DataSource", eumdac_datasource_test_date: str) -> None:
+    _, mock_load_data = eumdac_mocks
+    eumdac_datasource = getattr(importlib.import_module("downsat"), satellite)(DummyCredentials(), tmp_path)
 
     # download new data from data store
-    start_time = time.time()
-    path1 = eumdac_datasource[eumdac_datasource_test_date]
-    duration_1 = time.time() - start_time
+    path1 = eumdac_datasource[time_slot]
+    assert mock_load_data.call_count == 1
 
     # get data from file cache
-    start_time = time.time()
-    path2 = eumdac_datasource[eumdac_datasource_test_date]
-    duration_2 = time.time() - start_time
+    path2 = eumdac_datasource[time_slot]
+    assert mock_load_data.call_count == 1
 
     # cache works
     assert path1 == path2
-    assert duration_1 > 7  # data must be downloaded on the first request
-    assert duration_2 < 7  # data were already cached
 
 
 def test_msg(
@@ -107,17 +125,14 @@ def test_msg(
     assert all(isinstance(path, (Path, PosixPath)) for path in paths)
 
 
-@pytest.mark.parametrize("path_as_str", [False, True], ids=["path_as_Path", "path_as_str"])
+# test that the object accepts both Path and str paths
+@pytest.mark.parametrize("path_type", [Path, str], ids=["path_as_Path", "path_as_str"])
 def test_msg_data_path_type(
-    msg_archive_path: Path | str, eumdac_key: "EumdacKey", valid_msg_datetime: str, path_as_str: bool
+    msg_archive_path: Path, eumdac_key: "EumdacKey", valid_msg_datetime: str, path_type: type[Path | str]
 ) -> None:
     from downsat import MSG
 
-    if path_as_str:
-        # test that the object can accept string paths
-        msg_archive_path = str(msg_archive_path)
-
-    msg = MSG(eumdac_key, msg_archive_path)
+    msg = MSG(eumdac_key, path_type(msg_archive_path))
     path1 = msg[valid_msg_datetime]
 
     # single key should return list
@@ -133,39 +148,24 @@ def test_msg_data_path_type(
     ids=["str", "datetime", "arrow"],
 )
 def test_msg_input_formats(
-    tmp_path: Path, eumdac_key: "EumdacKey", time_slot: str | datetime.datetime
+    tmp_path: Path,
+    eumdac_key: "EumdacKey",
+    time_slot: str | datetime.datetime,
+    eumdac_mocks: tuple[MagicMock, MagicMock],
 ) -> None:
     """Test that MSG data source accepts different time slot formats."""
     from dateutil.tz import tzutc
 
     from downsat import MSG
-    from downsat.etl.metadata import setmeta
 
+    mock_query, _ = eumdac_mocks
     msg = MSG(eumdac_key, tmp_path)
 
-    # build sample eumdac client output  # TODO: turn into fixture
-    zip_io = BytesIO()
-    with ZipFile(zip_io, "w") as zip_file:
-        zip_file.writestr("some_file", b"some_data")
-    setmeta(zip_io, name="some_file")
-
-    # mock query and load_data_by_id methods of EumdacCollection not to actually download the data
-    # but test that the query is called with proper time range
-    with patch("downsat.clients.eumdac.EumdacCollection.query", autospec=True) as mock_query:
-        with patch(
-            "downsat.clients.eumdac.EumdacCollection._load_data_by_id", autospec=True
-        ) as mock_load_data:
-            mock_query.return_value = ("some_file",)
-            mock_load_data.return_value = zip_io
-
-            msg[time_slot]  # TODO: mock and test that the query gets proper dtstart and dtend
-            mock_query.assert_called_once()
-            assert mock_query.call_args.kwargs["dtstart"] == datetime.datetime(
-                2022, 11, 1, 15, 30, tzinfo=tzutc()
-            )
-            assert mock_query.call_args.kwargs["dtend"] == datetime.datetime(
-                2022, 11, 1, 15, 31, tzinfo=tzutc()
-            )
+    # test that the query is called with proper time range
+    msg[time_slot]
+    mock_query.assert_called_once()
+    assert mock_query.call_args.kwargs["dtstart"] == datetime.datetime(2022, 11, 1, 15, 30, tzinfo=tzutc())
+    assert mock_query.call_args.kwargs["dtend"] == datetime.datetime(2022, 11, 1, 15, 31, tzinfo=tzutc())
 
 
 @pytest.mark.parametrize("flatten", [True, False], ids=["flatten", "no_flatten"])
@@ -239,13 +239,7 @@ def test_metop(
     assert path1[0].exists()  # type: ignore  # TODO: Fix type hints of FlattenDataSource
 
 
-@pytest.mark.parametrize("satellite", ["MSG", "RSS", "Metop"], ids=["MSG", "RSS", "Metop"])
-def test_from_env(tmp_path: Path, satellite: str) -> None:
-    import importlib
-
-    # dynamically import the archive class/function
-    module = importlib.import_module("downsat")
-    satellite_object = getattr(module, satellite)
-
+@pytest.mark.network
+def test_from_env(tmp_path: Path, satellite_class: Any) -> None:
     # make sure the archives like MSG or Metop can be build from environment variables
-    satellite_object.from_env(data_path=tmp_path)
+    satellite_class.from_env(data_path=tmp_path)
@@ -26,11 +26,13 @@ def test_tle(
     spacetrack_object_id: int | str,
     spacetrack_key: "SpaceTrackKey",
     tle_dates: "TimeSlotType",
-    tmp_path: Path,
+    tle_archive_path: Path,
 ) -> None:
     from downsat.data_sources.tle import DailyTLE
 
-    tle = DailyTLE(object_id=spacetrack_object_id, credentials=spacetrack_key, data_path=tmp_path)  # type: ignore  # TODO: fix
+    # archive shared by all date formats => days already downloaded by other tests are read from disk
+    data_path = tle_archive_path / str(spacetrack_object_id)
+    tle = DailyTLE(object_id=spacetrack_object_id, credentials=spacetrack_key, data_path=data_path)  # type: ignore  # TODO: fix
 
     # must not crash
     daily_tle = tle[tle_dates]  # type: ignore  # TODO: fix
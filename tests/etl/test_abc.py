@@ -1,15 +1,16 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Hashable, Type
+from typing import TYPE_CHECKING, Any, Hashable, Iterator, Type
 from collections.abc import Sequence
 from functools import partial
-from pathlib import Path
 
 import pytest
-from pytest_cases import parametrize_with_cases
+from pytest_cases import fixture, parametrize_with_cases
 
 
 if TYPE_CHECKING:
+    from diskcache import Cache
+
     from downsat.etl import protocols
 
 
@@ -27,8 +28,6 @@ def case_transform_class_with_fields() -> tuple[Type["protocols.PipelineTransfor
 def case_transform_partial_class_with_fields() -> tuple[
     partial[Type["protocols.PipelineTransform"]], dict[str, Any]
 ]:
-    from functools import partial
-
     class TestTransform:
         def __init__(self, inp_arg: int) -> None:
             self.inp_arg = inp_arg
@@ -86,10 +85,11 @@ def case_datasource_class_with_fields_attrs() -> tuple[Type["protocols.DataSourc
     return TestSource, {"init_arg": 3}
 
 
+# run=False => the case is not even built, attrs slots classes are not supported yet
+@pytest.mark.xfail(reason="multikey_ds not yet implemented for slot classes", run=False)
 def case_datasource_class_with_fields_attrs_and_slots() -> tuple[
     Type["protocols.DataSource"], dict[str, Any]
 ]:
-    pytest.xfail("multikey_ds not yet implemented for slot classes")
     from attrs import define
 
     @define
@@ -151,8 +151,6 @@ def case_datasource_class_partial_with_fields_attrs_frozen() -> tuple[
     partial[Type["protocols.DataSource"]], dict[str, Any]
 ]:
     """DataSource with fields created by functools.partial and attrs.frozen."""
-    from functools import partial
-
     from attrs import frozen
 
     @frozen(slots=False)
@@ -169,10 +167,19 @@ def case_query_cache_none() -> None:
     return None
 
 
-def case_query_cache_diskcache(tmp_path: Path) -> "protocols.Dataset":
+@pytest.fixture(scope="module")
+def query_diskcache(tmp_path_factory: pytest.TempPathFactory) -> Iterator["Cache"]:
+    """Disk cache shared by the tests of this module, closed at the end of the module."""
     from diskcache import Cache
 
-    return Cache(directory=tmp_path)
+    with Cache(directory=tmp_path_factory.mktemp("query_cache")) as cache:
+        yield cache
+
+
+def case_query_cache_diskcache(query_diskcache: "Cache") -> "protocols.Dataset":
+    # start from an empty cache so that queries of the previous test are not reused
+    query_diskcache.clear()
+    return query_diskcache
 
 
 def test_incomplete_pipeline_transform() -> None:
@@ -361,9 +368,10 @@ def test_query(
         assert query_fun.n_queries == 3  # type: ignore  # mypy doesn't like this trick
 
 
-def test_cache() -> None:
+@fixture(unpack_into="CounterDict,CounterSink")
+def counter_dicts() -> tuple[type, type]:
+    """Multikey data source and cache sink that count get and set operations."""
     from downsat.etl.abc import MultiKeyDataSource
-    from downsat.etl.class_transforms import cache
 
     class CounterDict(MultiKeyDataSource):
         def __init__(self, init_dict: dict | None = None) -> None:
@@ -401,6 +409,12 @@ def test_cache() -> None:
         def __init__(self) -> None:
             super().__init__()
 
+    return CounterDict, CounterSink
+
+
+def test_cache(CounterDict: Any, CounterSink: Any) -> None:
+    from downsat.etl.class_transforms import cache
+
     Dataset = cache(CounterDict, cache=CounterSink)
     dataset = Dataset(init_dict={"a": 0, "b": 1})  # type: ignore  # TODO: fix, make mypy plugin
     source = dataset._datasource  # type: ignore  # TODO: fix, make mypy plugin
@@ -433,7 +447,10 @@ def test_cache() -> None:
     res = dataset[query]
     assert len(res) == 2
 
-    # skip_if works
+
+def test_cache_skip_if(CounterDict: Any, CounterSink: Any) -> None:
+    from downsat.etl.class_transforms import cache
+
     Dataset_skip = cache(CounterDict, cache=CounterSink, skip_if=lambda key, _: key == "a")
     dataset_skip = Dataset_skip(init_dict={"a": 0, "b": 1})  # type: ignore  # TODO: fix, make mypy plugin
     cache_skip = dataset_skip._cache  # type: ignore  # TODO: fix, make mypy plugin
@@ -443,7 +460,20 @@ def test_cache() -> None:
     assert dataset_skip["b"] == 1
     assert len(cache_skip.data_dict) == 1  # "b" was cached
 
-    # applies transform
+
+def test_cache_nested_keys(CounterDict: Any, CounterSink: Any) -> None:
+    from downsat.etl.class_transforms import cache
+
+    Dataset = cache(CounterDict, cache=CounterSink)
+    dataset = Dataset(init_dict={1: 10, 2: 20, 3: 30})  # type: ignore  # TODO: fix, make mypy plugin
+
+    # nested tuples of keys are resolved recursively
+    assert dataset[(1, (2, 3))] == (10, (20, 30))
+    assert dataset._cache.data_dict == {1: 10, 2: 20, 3: 30}  # type: ignore  # TODO: fix, make mypy plugin
+
+
+def test_cache_applies_transform(CounterDict: Any, CounterSink: Any) -> None:
+    from downsat.etl.class_transforms import cache
 
     def transform(x: int) -> int:
         return x + 1
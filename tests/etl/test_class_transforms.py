@@ -1,6 +1,6 @@
 def test_multikey_ds_on_class() -> None:
 
-    from collections import UserDict
+    from collections import UserDict, namedtuple
 
     from downsat.etl import abc, protocols
     from downsat.etl.class_transforms import multikey_ds
@@ -17,8 +17,64 @@ def test_multikey_ds_on_class() -> None:
     # multi-key getitem works
     assert container["a", "b"] == (1, 2)
 
+    # tuple subclasses are treated as multiple keys as well
+    Keys = namedtuple("Keys", ["first", "second"])
+    assert container[Keys("a", "b")] == (1, 2)
+
     # DictLike fufills protocol MultiKeyDataSource
     assert isinstance(container, protocols.MultiKeyDataSource)
 
     # DictLike is an ancestor of MultiKeyDataSource
     assert isinstance(container, abc.MultiKeyDataSource)
+
+
+def test_chained_transforms() -> None:
+    from downsat.etl.class_transforms import transform_ds_input, transform_ds_output
+
+    class Source:
+        def __getitem__(self, key: int) -> tuple[str, int]:
+            return ("src", key)
+
+    def add1(inp: int) -> int:
+        return inp + 1
+
+    def fan_out(inp: int) -> tuple[int, ...]:
+        return (inp, inp + 1)
+
+    # chained input transforms
+    InnerSource = transform_ds_input(add1, Source)
+    InputSource = transform_ds_input(add1, InnerSource)
+    assert InputSource()[3] == ("src", 5)
+    assert InputSource()[3, 4] == (("src", 5), ("src", 6))
+
+    # outer transform turning a key into multiple keys fans out to the inner layer
+    FanOutSource = transform_ds_input(fan_out, InnerSource)
+    assert FanOutSource()[10] == (("src", 11), ("src", 12))
+
+    # inner layer is kept as it is, not copied
+    assert type(FanOutSource()._datasource) is InnerSource
+
+    # chained output transforms
+    OutputSource = transform_ds_output(transform_ds_output(Source, lambda out: out[1]), add1)
+    assert OutputSource()[3] == 4
+
+
+def test_concretized_classes_are_independent() -> None:
+    from downsat.etl.class_transforms import transform_ds_output
+    from downsat.etl.context import getcontext, setcontext
+
+    class Source:
+        def __getitem__(self, key: int) -> int:
+            return key * 10
+
+    def add1(inp: int) -> int:
+        return inp + 1
+
+    Source1 = transform_ds_output(Source, add1)
+    Source2 = transform_ds_output(Source, add1)
+    assert Source1 is not Source2
+
+    # run context of one pipeline does not leak to another
+    setcontext(num_workers=3)(Source1)
+    assert getcontext(Source1) == {"num_workers": 3}
+    assert getcontext(Source2) == {}
@@ -1,3 +1,6 @@
+from pytest_mock import MockerFixture
+
+
 def test_extract_fields_from_partial() -> None:
     """Test that _extract_fields can handle partial functions."""
     from functools import partial
@@ -17,3 +20,42 @@ def test_extract_fields_from_partial() -> None:
     assert len(fields) == 1
     assert "b" in fields
     assert "a" not in fields
+
+
+def test_callable_signature_to_fields_is_cached(mocker: MockerFixture) -> None:
+    """Test that class signature is inspected only once and new fields are built on every call."""
+    import inspect
+
+    from downsat.etl.class_utils import _callable_signature_to_fields
+
+    class A:
+        def __init__(self, a: int, b: int = 2) -> None:
+            ...
+
+    signature = mocker.spy(inspect, "signature")
+
+    fields1 = _callable_signature_to_fields(A)
+    fields2 = _callable_signature_to_fields(A)
+
+    assert signature.call_count == 1
+    assert list(fields1) == list(fields2) == ["a", "b"]
+    assert fields1["a"] is not fields2["a"]
+    assert fields1["b"]._default == fields2["b"]._default == 2
+
+
+def test_build_constant_property() -> None:
+    from abc import ABC, abstractmethod
+
+    from downsat.etl.class_utils import _build_constant_property
+
+    class Base(ABC):
+        @abstractmethod
+        def _fun(self) -> None:
+            ...
+
+    # functions are returned unbound and override abstract methods
+    Class = type(
+        "Class", (Base,), {"_fun": _build_constant_property(len), "_obj": _build_constant_property(3)}
+    )
+    assert Class()._fun is len
+    assert Class()._obj == 3
@@ -1,4 +1,5 @@
 from typing import Any, Type
+import threading
 
 import pytest
 from pytest_cases import parametrize_with_cases
@@ -61,10 +62,58 @@ def test_setcontext(class_with_context: Type) -> None:
     setcontext(invalid_value=5, _strict=False)
 
 
+def test_setcontext_local() -> None:
+    from downsat.etl import context
+    from downsat.etl.context import RUN_CONTEXT_DUNDER, getcontext, setcontext
+
+    class Parent:
+        _etl_run_context_: dict = {}
+
+    class Child(Parent):
+        ...
+
+    assert RUN_CONTEXT_DUNDER == "_etl_run_context_"
+
+    # context is stored in the class attribute, not in the global dict
+    setcontext(num_workers=3)(Parent)
+    assert Parent._etl_run_context_ == {"num_workers": 3}
+    assert Parent not in context._global_context_dict
+
+    # inherited context dict is not shared with subclasses and instances
+    setcontext(num_workers=2)(Child)
+    setcontext(num_workers=1)(Parent())
+    assert getcontext(Parent) == {"num_workers": 3}
+    assert getcontext(Child) == {"num_workers": 2}
+
+
+@parametrize_with_cases("class_with_context", cases=".", prefix="class")
+def test_run_context_cache(class_with_context: Type) -> None:
+    from downsat.etl.context import RunContext, setcontext
+
+    c = class_with_context()
+
+    # run context is built only once
+    run_context = RunContext.from_obj(c)
+    assert RunContext.from_obj(c) is run_context
+
+    # setcontext invalidates cached run context
+    setcontext(num_workers=3)(c)
+    assert RunContext.from_obj(c) is not run_context
+    assert RunContext.from_obj(c).num_workers == 3
+
+    # setcontext on another object keeps the cached run context
+    run_context = RunContext.from_obj(c)
+    setcontext(num_workers=2)(class_with_context())
+    assert RunContext.from_obj(c) is run_context
+
+
 def test_context_map(mocker: MockerFixture) -> None:
     from downsat.etl import context
 
     mocker.patch("downsat.etl.context.Parallel")
+    mocker.patch("downsat.etl.context.ThreadPoolExecutor")
+    mocker.patch("downsat.etl.context._parallel_pools", {})
+    mocker.patch("downsat.etl.context._thread_pools", {})
 
     def mapfun(element: Any) -> None:  # noqa: U100
         pass
@@ -75,13 +124,104 @@ def test_context_map(mocker: MockerFixture) -> None:
     serial_context = context.RunContext(max_workers=0)
     serial_context.map(mapfun, data)
     context.Parallel.assert_not_called()
+    context.ThreadPoolExecutor.assert_not_called()
 
     # parallel processing calls joblib.Parallel with correct number of jobs
     parallel_context = context.RunContext()
     parallel_context.map(mapfun, data)
     context.Parallel.assert_not_called()  # single serial job if not specified otherwise
-    context.Parallel.reset_mock()
+    context.ThreadPoolExecutor.assert_not_called()
+
+    parallel_context = context.RunContext(num_workers=5, max_workers=3, backend="loky")
+    parallel_context.map(mapfun, data)
+    context.Parallel.assert_called_once_with(n_jobs=3, backend="loky")
 
+    # threading backend uses thread pool directly
     parallel_context = context.RunContext(num_workers=5, max_workers=3)
     parallel_context.map(mapfun, data)
-    context.Parallel.assert_called_once_with(n_jobs=3)
+    context.ThreadPoolExecutor.assert_called_once_with(max_workers=3, initializer=context._mark_worker_thread)
+    context.ThreadPoolExecutor.return_value.map.assert_called_once_with(mapfun, data)
+
+
+def test_context_map_reuses_pool(mocker: MockerFixture) -> None:
+    from downsat.etl import context
+
+    mocker.patch("downsat.etl.context.Parallel")
+    mocker.patch("downsat.etl.context.ThreadPoolExecutor")
+    mocker.patch("downsat.etl.context._parallel_pools", {})
+    mocker.patch("downsat.etl.context._thread_pools", {})
+
+    def mapfun(element: Any) -> None:  # noqa: U100
+        pass
+
+    data = [None] * 3
+
+    # repeated parallel processing opens joblib.Parallel only once
+    parallel_context = context.RunContext(num_workers=3, backend="loky")
+    parallel_context.map(mapfun, data)
+    parallel_context.map(mapfun, data)
+    context.Parallel.assert_called_once_with(n_jobs=3, backend="loky")
+    context.Parallel.return_value.__enter__.assert_called_once()
+    assert context.Parallel.return_value.call_count == 2
+
+    # repeated parallel processing in threads creates thread pool only once
+    parallel_context = context.RunContext(num_workers=3)
+    parallel_context.map(mapfun, data)
+    parallel_context.map(mapfun, data)
+    context.ThreadPoolExecutor.assert_called_once_with(max_workers=3, initializer=context._mark_worker_thread)
+    assert context.ThreadPoolExecutor.return_value.map.call_count == 2
+
+    # pools are closed at program exit
+    context._close_parallel_pools()
+    context.Parallel.return_value.__exit__.assert_called_once()
+    context.ThreadPoolExecutor.return_value.shutdown.assert_called_once_with(wait=False)
+
+
+def test_context_map_nested_threads() -> None:
+    from downsat.etl.context import RunContext
+
+    run_context = RunContext(num_workers=2)
+
+    # nested parallel processing does not deadlock
+    result = run_context.map(lambda x: run_context.map(lambda y: x * y, (1, 2, 3)), (1, 2, 3))
+    assert result == ((1, 2, 3), (2, 4, 6), (3, 6, 9))
+
+
+def test_context_map_nested_threads_share_pool() -> None:
+    from downsat.etl import context
+    from downsat.etl.context import RunContext
+
+    run_context = RunContext(num_workers=4)
+    run_context.map(lambda x: x, (1, 2))
+    num_threads = threading.active_count()
+    num_pools = len(context._thread_pools)
+
+    # nested calls run in the worker threads of the shared pool, no new pools nor threads are created
+    result = run_context.map(lambda x: run_context.map(lambda y: x * y, (1, 2, 3, 4)), (1, 2, 3, 4))
+    assert result[1] == (2, 4, 6, 8)
+    assert len(context._thread_pools) == num_pools
+    assert threading.active_count() <= num_threads + 4
+
+
+@pytest.mark.parametrize("num_workers", [1, 2])
+def test_context_map_generator(num_workers: int) -> None:
+    from downsat.etl.context import RunContext
+
+    # generators are consumed only once
+    assert RunContext(num_workers=num_workers).map(lambda x: 2 * x, (i for i in range(5))) == (0, 2, 4, 6, 8)
+
+
+def test_context_batch_size() -> None:
+    from downsat.etl.context import RunContext
+
+    # too few items to be batched
+    assert RunContext().get_batch_size(num_workers=4, num_items=7) == "auto"
+
+    # each worker gets batch_size_factor batches
+    assert RunContext().get_batch_size(num_workers=4, num_items=160) == 10
+    assert RunContext(batch_size_factor=2).get_batch_size(num_workers=4, num_items=160) == 20
+    assert RunContext(batch_size_factor=100).get_batch_size(num_workers=4, num_items=160) == 1
+
+    # invalid batch size factor
+    with pytest.raises(ValueError):
+        RunContext(batch_size_factor=0)
@@ -7,6 +7,7 @@ from trollsift import Parser
 
 from downsat.etl import converters
 from downsat.etl.weakref import List as MetaList
+from downsat.etl.weakref import Path as MetaPath
 
 
 if TYPE_CHECKING:
@@ -45,6 +46,22 @@ def test_mapping_to_filesystem(random_xrimage: "XRImage", tmp_path: Path) -> Non
         assert tmp_path / "test_folder" / fname in files
 
 
+def test_mapping_to_filesystem_metacache(tmp_path: Path) -> None:
+    from downsat.etl.converters import to_filesystem
+    from downsat.etl.metadata import setmeta
+
+    dict_to_save = {f"file{i}.txt": StringIO(f"text {i}") for i in range(5)}
+    for i, text_buf in enumerate(dict_to_save.values()):
+        setmeta(text_buf, index=i)
+
+    # metadata of the folder and all the files are stored
+    metacache: dict = {}
+    path: Path = to_filesystem(dict_to_save, tmp_path / "test_folder", metacache=metacache)  # type: ignore
+    assert len(metacache) == 6
+    assert metacache[path] == {}
+    assert metacache[path / "file3.txt"] == {"index": 3}
+
+
 @pytest.mark.parametrize(
     "input",
     [
@@ -54,9 +71,7 @@ def test_mapping_to_filesystem(random_xrimage: "XRImage", tmp_path: Path) -> Non
     ids=["string", "parser"],
 )
 def test_to_parser(input: Any) -> None:
-    from downsat.etl.converters import to_parser
-
-    result = to_parser(input)
+    result = converters.to_parser(input)
     assert isinstance(result, Parser)
 
 
@@ -69,10 +84,8 @@ def test_to_parser(input: Any) -> None:
     ],
 )
 def test_to_parser_invalid_input(input: Any) -> None:
-    from downsat.etl.converters import to_parser
-
     with pytest.raises(NotImplementedError):
-        to_parser(input)
+        converters.to_parser(input)
 
 
 @pytest.mark.parametrize(
@@ -90,3 +103,43 @@ def test_keeps_metadata(func: Callable, input: Any) -> None:
     setmeta(input, **metadata)
     output = func(input)
     assert getmeta(output) == metadata
+
+
+def test_to_path_collections() -> None:
+    from downsat.etl.converters import to_path
+
+    meta_path = MetaPath("a")
+
+    # MetaPaths are kept, paths are converted to MetaPaths
+    assert to_path((meta_path,))[0] is meta_path  # type: ignore
+    for paths in ([Path("a"), Path("b")], {Path("a"), Path("b")}, (meta_path, Path("b"))):
+        result = to_path(paths)
+        assert type(result) is {list: MetaList, set: set, tuple: tuple}[type(paths)]
+        assert all(type(path) is MetaPath for path in result)  # type: ignore
+
+
+def test_path_to_filesystem(tmp_path: Path) -> None:
+    from downsat.etl.converters import to_filesystem
+
+    source = tmp_path / "source.txt"
+    source.write_text("test")
+    source.chmod(0o640)
+
+    path = to_filesystem(source, tmp_path / "destination.txt")  # type: ignore
+    assert path.read_text() == "test"  # type: ignore
+    assert not path.samefile(source)  # type: ignore
+    assert path.stat().st_mode == source.stat().st_mode  # type: ignore  # permissions are copied
+
+
+def test_tuple_to_filesystem(tmp_path: Path) -> None:
+    from downsat.etl.converters import to_filesystem
+
+    # larger collections are saved in parallel, order is kept
+    sources = []
+    for i in range(10):
+        source = tmp_path / f"source_{i}.txt"
+        source.write_text(str(i))
+        sources.append(source)
+
+    paths = to_filesystem(tuple(sources))
+    assert tuple(path.read_text() for path in paths) == tuple(str(i) for i in range(10))  # type: ignore
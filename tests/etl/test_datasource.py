@@ -17,31 +17,37 @@ def test_multidatasource(tmp_path: Path) -> None:
     dataset2["b"] = StringIO("b")  # type: ignore  # TODO: fix  # TODO: FileDataset should use toStringIO decorator
 
     # multidataset works
-    with open(datasource["a"][0]) as f:
-        assert f.read() == "a"
-
-    with open(datasource["b"][0]) as f:
-        assert f.read() == "b"
+    assert datasource["a"][0].read_text() == "a"
+    assert datasource["b"][0].read_text() == "b"
 
     # first dataset is prioritized
     dataset1["b"] = StringIO("c")  # type: ignore  # TODO: fix  # TODO: FileDataset should use toStringIO decorator
 
-    with open(datasource["b"][0]) as f:
-        assert f.read() == "c"
+    assert datasource["b"][0].read_text() == "c"
 
     # strategy 'all' should return all matches
     datasource = MultiDataSource([dataset1, dataset2], search_strategy="all")  # type: ignore  # TODO: fix
     value_b = datasource["b"]
     assert len(value_b) == 2
 
-    with open(value_b[0]) as f:
-        val1 = f.read()
-
-    with open(value_b[1]) as f:
-        val2 = f.read()
-
-    assert (val1 == "b" and val2 == "c") or (val1 == "c" and val2 == "b")
+    # values are ordered by datasources
+    assert [path.read_text() for path in value_b] == ["c", "b"]
 
     # strategy 'all' should return unique items only
     datasource = MultiDataSource([dataset1, dataset2, dataset2], search_strategy="all")  # type: ignore  # TODO: fix
     assert len(datasource["b"]) == 2
+
+
+def test_multidatasource_nested_keys() -> None:
+    from downsat.etl.datasource import MultiDataSource
+
+    class Source(dict):
+        def __getitem__(self, key: str | tuple[str, ...]) -> str | tuple[str, ...]:
+            if isinstance(key, tuple):
+                return tuple(self[k] for k in key)
+            return super().__getitem__(key)
+
+    datasource = MultiDataSource([Source(a="1", b="2", c="3")])  # type: ignore  # TODO: fix
+
+    # nested tuples of keys are resolved recursively
+    assert datasource["a", ("b", "c")] == (("1",), (("2",), ("3",)))
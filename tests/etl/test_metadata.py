@@ -64,13 +64,43 @@ def test_setmetadata(data_class: Type) -> None:
     from downsat.etl.metadata import getmeta, setmeta
 
     data = data_class()
-    meta_dict = {"a": 5, "b": datetime.datetime.now()}
+    meta_dict = {"a": 5, "b": datetime.datetime(2022, 11, 1, 15, 30)}
 
     # context can be set and recovered
     setmeta(data, **meta_dict)
     assert getmeta(data) == meta_dict
 
 
+def test_keepmeta_custom_storage() -> None:
+    from downsat.etl.metadata import get_local_metadata, getmeta, keepmeta, set_local_metadata, setmeta
+
+    class CustomStorage:
+        def __init__(self) -> None:
+            self.stored: dict[str, Any] = {}
+            self.n_updates = 0
+
+    @get_local_metadata.register
+    def _(obj: CustomStorage) -> dict[str, Any]:
+        return dict(obj.stored)
+
+    @set_local_metadata.register
+    def _(obj: CustomStorage, **kwargs: Any) -> None:
+        obj.stored.update(kwargs)
+        obj.n_updates += 1
+
+    @keepmeta
+    def copy(inp: CustomStorage) -> CustomStorage:
+        return CustomStorage()
+
+    data = CustomStorage()
+    setmeta(data, a=1, b=2)
+
+    # metadata are copied through the overloaded setter
+    data_copy = copy(data)
+    assert data_copy.n_updates == 1
+    assert getmeta(data_copy) == {"a": 1, "b": 2}
+
+
 @parametrize_with_cases("data_class", cases=".", prefix="class")
 def test_clearmeta(data_class: Type) -> None:
     import datetime
@@ -78,7 +108,7 @@ def test_clearmeta(data_class: Type) -> None:
     from downsat.etl.metadata import clearmeta, getmeta, setmeta
 
     data = data_class()
-    meta_dict = {"a": 5, "b": datetime.datetime.now()}
+    meta_dict = {"a": 5, "b": datetime.datetime(2022, 11, 1, 15, 30)}
 
     setmeta(data, **meta_dict)
     assert getmeta(data) == meta_dict
@@ -95,7 +125,7 @@ def test_obj_with_attrs(attrs_data_class: Type) -> None:
     from downsat.etl.metadata import getmeta, setmeta
 
     data = attrs_data_class()
-    meta_dict = {"a": 5, "b": datetime.datetime.now()}
+    meta_dict = {"a": 5, "b": datetime.datetime(2022, 11, 1, 15, 30)}
 
     # context is set and recovered from attrs
     setmeta(data, **meta_dict)
@@ -121,7 +151,7 @@ def test_keepmeta() -> None:
     # normal func
     @keepmeta
     def func(a: set) -> set:
-        return set([v for v in a])  # create new set without metadata
+        return set(a)  # create new set without metadata
 
     testset = set([1, 2, 3])
     metadata = {"a": 5, "b": "test"}
@@ -138,8 +168,28 @@ def test_keepmeta() -> None:
     @test_func.register
     @keepmeta
     def _(a: set) -> set:
-        return set([v for v in a])  # create new set without metadata
+        return set(a)  # create new set without metadata
 
     transformed_set = test_func(testset)
 
     assert getmeta(transformed_set) == metadata
+
+
+def test_keepmeta_local_metadata() -> None:
+    from downsat.etl.metadata import getmeta, keepmeta
+
+    class Data:
+        def __init__(self) -> None:
+            self.attrs = {"a": 1}
+
+    @keepmeta
+    def func(data: Data) -> Data:
+        return Data()
+
+    # local metadata dict of the output is updated
+    data = Data()
+    data.attrs["b"] = 2
+    assert getmeta(func(data)) == {"a": 1, "b": 2}
+
+    # no metadata to be copied
+    assert getmeta(func(object())) == {"a": 1}
@@ -18,14 +18,15 @@ def test_filter() -> None:
     filter_seq = Filter(filter_fun)
     data = List([10, 20, 30])
     setmeta(data, max=15)
-    assert filter_seq(data) == [20, 30]
-    assert isinstance(filter_seq(data), list)
-    assert getmeta(filter_seq(data)) == {"max": 15}
+    filtered = filter_seq(data)
+    assert filtered == [20, 30]
+    assert isinstance(filtered, list)
+    assert getmeta(filtered) == {"max": 15}
 
 
 def test_unzip_transform() -> None:
     from io import BytesIO
-    from zipfile import BadZipFile, ZipFile
+    from zipfile import ZIP_DEFLATED, BadZipFile, ZipFile
 
     from downsat.etl.metadata import getmeta, setmeta
     from downsat.etl.transforms import UnzipBuffer
@@ -54,6 +55,17 @@ def test_unzip_transform() -> None:
     assert extracted["file2.txt"].getvalue() == b"world"
     assert getmeta(extracted) == test_metadata
 
+    # Test with many compressed files extracted in parallel
+    many_zip_io = BytesIO()
+    with ZipFile(many_zip_io, "w", compression=ZIP_DEFLATED) as zipf:
+        for i in range(20):
+            zipf.writestr(f"file{i}.txt", str(i) * 1000)
+    many_zip_io.seek(0)
+
+    extracted = transform(many_zip_io)
+    assert list(extracted) == [f"file{i}.txt" for i in range(20)]
+    assert all(extracted[f"file{i}.txt"].getvalue() == str(i).encode() * 1000 for i in range(20))
+
     # Test with non-zip file
     non_zip = BytesIO(b"This is not a zip file.")
     with pytest.raises(BadZipFile):
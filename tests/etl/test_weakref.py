@@ -43,7 +43,7 @@ def class_attrs_frozen() -> Type:
 
 @parametrize_with_cases("test_class", cases=".", prefix="class")
 def test_weak_id_key_dictionary(test_class: Type) -> None:
-    import gc
+    import weakref
 
     from downsat.etl.context import WeakIdKeyDictionary
 
@@ -71,8 +71,10 @@ def test_weak_id_key_dictionary(test_class: Type) -> None:
     assert instance2 not in weak_dict
 
     # when an instance is deleted, it is removed from the dict
+    # the dict must not create reference cycles => the instance is freed without a full gc.collect()
+    instance1_ref = weakref.ref(instance1)
     del instance1
-    gc.collect()
+    assert instance1_ref() is None
     assert len(weak_dict) == 0
     assert instance2 not in weak_dict
 
@@ -90,6 +92,42 @@ def test_weak_id_key_dictionary(test_class: Type) -> None:
     assert weak_dict.get(instance2) == weak_dict[instance2]
 
 
+def test_weak_id_key_dictionary_detaches_finalizers() -> None:
+    import weakref
+
+    from downsat.etl.weakref import WeakIdKeyDictionary
+
+    class TestClass:
+        ...
+
+    instance1 = TestClass()
+    instance2 = TestClass()
+    instance3 = TestClass()
+
+    # TODO: why WeakIdKeyDictionary[Any, Any] has to be specified?
+    weak_dict: WeakIdKeyDictionary[Any, Any] = WeakIdKeyDictionary()
+    weak_dict[instance1] = 1
+    weak_dict[instance2] = 2
+    weak_dict[instance3] = 3
+    finalizers = dict(weak_dict._finalizers)
+
+    # pop, del and clear remove the records together with their finalizers
+    assert weak_dict.pop(instance1) == 1
+    assert weak_dict.pop(instance1, -1) == -1
+    del weak_dict[instance2]
+    weak_dict.clear()
+    assert len(weak_dict) == 0
+    assert not weak_dict._finalizers
+    assert not any(finalizer.alive for finalizer in finalizers.values())
+
+    # the object is tracked again once re-inserted
+    weak_dict[instance3] = 4
+    instance3_ref = weakref.ref(instance3)
+    del instance3
+    assert instance3_ref() is None
+    assert len(weak_dict) == 0
+
+
 def test_weakref_path() -> None:
     from downsat.etl.weakref import Path, WeakIdKeyDictionary
 
@@ -108,30 +146,23 @@ def test_weakref_path() -> None:
     assert len(weak_dict) == 0
 
 
-def test_weakref_custom_containers() -> None:
-    # TODO: parametrize
-    from downsat.etl.weakref import List, MetaStr, WeakIdKeyDictionary
+@pytest.mark.parametrize(
+    "container_name, value", [("List", [1, 2, 3]), ("MetaStr", "Test string")], ids=["List", "MetaStr"]
+)
+def test_weakref_custom_containers(container_name: str, value: Any) -> None:
+    from downsat.etl import weakref
+    from downsat.etl.weakref import WeakIdKeyDictionary
+
+    container = getattr(weakref, container_name)(value)
 
     # TODO: why WeakIdKeyDictionary[Any, Any] has to be specified?
     weak_dict: WeakIdKeyDictionary[Any, Any] = WeakIdKeyDictionary()
+    weak_dict[container] = 5
 
-    # List
-    list_ = List([1, 2, 3])
-
-    weak_dict[list_] = 1
-    assert len(weak_dict) == 1
-
-    del list_
-    assert len(weak_dict) == 0
-
-    # Str
-    s = MetaStr("Test string")
-    weak_dict[s] = 5
-
-    assert weak_dict[s] == 5
+    assert weak_dict[container] == 5
     assert len(weak_dict) == 1
 
-    del s
+    del container
     assert len(weak_dict) == 0
 
 
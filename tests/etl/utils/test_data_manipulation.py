@@ -0,0 +1,27 @@
+import pytest
+
+
+def test_flatten() -> None:
+    from downsat.etl.utils.data_manipulation import flatten
+    from downsat.etl.weakref import List as MetaList
+
+    nested = (1, [2, (3, [4])], MetaList([5]), "ab")
+
+    assert flatten(nested) == (1, 2, (3, [4]), 5, "ab")
+    assert flatten(nested, depth=2) == (1, 2, 3, [4], 5, "ab")
+    assert flatten(nested, depth=3) == (1, 2, 3, 4, 5, "ab")
+
+    # only tuples are flattened
+    assert flatten(1) == 1
+    assert flatten([1, (2,)]) == [1, (2,)]
+
+    # tuple of tuples
+    assert flatten(((1, 2), (3, (4, [5])))) == (1, 2, 3, (4, [5]))
+    assert flatten(((1, 2), (3, (4, [5]))), depth=3) == (1, 2, 3, 4, 5)
+
+    # flat input is returned as is
+    flat = (1, "ab", 2.0)
+    assert flatten(flat, depth=2) is flat
+
+    with pytest.raises(ValueError):
+        flatten(nested, depth=0)
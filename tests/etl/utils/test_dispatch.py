@@ -0,0 +1,60 @@
+from typing import Any
+
+
+def test_typedispatch() -> None:
+    from abc import ABC
+    from collections.abc import Mapping
+
+    from downsat.etl.utils.dispatch import typedispatch
+
+    @typedispatch
+    def fun(inp: Any) -> str:
+        return "default"
+
+    @fun.register
+    def _(inp: Mapping) -> str:
+        return "mapping"
+
+    class Base(ABC):
+        ...
+
+    class Child:
+        ...
+
+    # dispatch by registered types, their subclasses and abstract base classes
+    assert fun(1) == "default"
+    assert fun({}) == "mapping"
+    assert fun(Child()) == "default"
+
+    # newly registered implementations and virtual subclasses are taken into account
+    @fun.register
+    def _(inp: Base) -> str:
+        return "base"
+
+    assert fun(Child()) == "default"
+    Base.register(Child)
+    assert fun(Child()) == "base"
+    assert fun.dispatch(Child) is fun.registry[Base]
+
+
+def test_typedispatch_does_not_keep_classes_alive() -> None:
+    import gc
+    import weakref
+
+    from downsat.etl.utils.dispatch import typedispatch
+
+    @typedispatch
+    def fun(inp: Any) -> str:
+        return "default"
+
+    class Dynamic:
+        ...
+
+    assert fun(Dynamic()) == "default"
+
+    # classes are freed once not used anywhere else
+    # Note: classes always form reference cycles => full gc.collect() is needed
+    dynamic_ref = weakref.ref(Dynamic)
+    del Dynamic
+    gc.collect()
+    assert dynamic_ref() is None
@@ -1,19 +1,33 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 import datetime
 from pathlib import Path
 
 
 if TYPE_CHECKING:
+    from arrow import Arrow
+    from pytest_mock import MockerFixture
+
     from downsat import SpaceTrackKey
 
 
-def test_find_visible_polar_passes(tmp_path: Path, spacetrack_key: "SpaceTrackKey") -> None:
+# TLEs of two consecutive days, the satellite name is arbitrary
+TLE_DAY1 = """SAT-A
+1 25544U 98067A   08264.51782528 -.00002182  00000-0 -11606-4 0  2927
+2 25544  51.6416 247.4627 0006703 130.5360 325.0288 15.72125391563537
+"""
+TLE_DAY2 = """SAT-A
+1 25544U 98067A   08265.51782528 -.00002182  00000-0 -11606-4 0  2928
+2 25544  51.6416 247.4627 0006703 130.5360 325.0288 15.72125391563537
+"""
+
+
+def test_find_visible_polar_passes(tle_archive_path: Path, spacetrack_key: "SpaceTrackKey") -> None:
     from functools import partial
 
     from downsat import DailyTLE, LonLat
-    from downsat.query.polar import find_visible_polar_passes
+    from downsat.query.polar import find_visible_polar_passes, iter_visible_polar_passes
 
-    tle_archive = partial(DailyTLE, credentials=spacetrack_key, data_path=tmp_path / "tle")
+    tle_archive = partial(DailyTLE, credentials=spacetrack_key, data_path=tle_archive_path)
     lonlat = LonLat(lon=14.41854, lat=50.07366)  # Prague
     time = "2023-06-20 9:00"
     dt = datetime.timedelta(hours=1)
@@ -23,6 +37,9 @@ def test_find_visible_polar_passes(tmp_path: Path, spacetrack_key: "SpaceTrackKe
     passes = find_visible_polar_passes(lonlat, time, tle_archive, satellite=satellite, dt=dt)
     assert len(passes) == 1
 
+    # lazy variant yields the same passes
+    assert tuple(iter_visible_polar_passes(lonlat, time, tle_archive, satellite, dt=dt)) == passes
+
     # works for multiple satellites
     multi_sat_passes = find_visible_polar_passes(
         lonlat, time, tle_archive, satellite=["METOP-A", "METOP-B"], dt=dt
@@ -53,8 +70,62 @@ def test_find_visible_polar_passes(tmp_path: Path, spacetrack_key: "SpaceTrackKe
     passes = find_visible_polar_passes(lonlat, time_now, tle_archive, satellite=satellite, dt=dt)
     assert len(passes) > 0
     # passes must be withing specified range
-    assert all(
-        (pass_.datetime.replace(tzinfo=None) >= time_now - dt)
-        & (pass_.datetime.replace(tzinfo=None) <= time_now + dt)
-        for pass_ in passes
-    )
+    assert all(time_now - dt <= pass_.datetime.replace(tzinfo=None) <= time_now + dt for pass_ in passes)
+
+
+def test_get_orbital_cache(tmp_path: Path) -> None:
+    from downsat.query.polar import _get_orbital
+
+    tle_file = tmp_path / "tle.txt"
+    tle_file.write_text(TLE_DAY1)
+
+    class TLEArchive:
+        def __init__(self, satellite: str) -> None:
+            self.satellite = satellite
+
+        def __getitem__(self, date: datetime.date) -> list[Path]:
+            return [tle_file]
+
+    date = datetime.date(2008, 9, 21)
+
+    # orbit model is built only once for the same TLE
+    orbital = _get_orbital("SAT-A", date, 1, TLEArchive)
+    assert _get_orbital("SAT-A", date, 1, TLEArchive) is orbital
+
+    # updated TLE is used once available
+    tle_file.write_text(TLE_DAY2)
+    assert _get_orbital("SAT-A", date, 1, TLEArchive) is not orbital
+
+
+def test_find_visible_polar_passes_parallel(mocker: "MockerFixture") -> None:
+    from downsat import LonLat
+    from downsat.query.polar import find_visible_polar_passes
+
+    class Orbital:
+        def __init__(self, satellite: str) -> None:
+            self.satellite = satellite
+
+        def get_next_passes(self, utc_time: "Arrow", **kwargs: Any) -> list[tuple["Arrow", ...]]:
+            # one pass per satellite, shifted by the satellite number
+            pass_time = utc_time.shift(hours=1, minutes=int(self.satellite[-1]))
+            return [(pass_time, pass_time, pass_time)]
+
+    mocker.patch("downsat.query.polar._get_orbital", lambda satellite, *args: Orbital(satellite))
+    satellites = [f"SAT-{i}" for i in range(1, 6)]
+
+    def find_passes(num_workers: int | None) -> dict[str, tuple["Arrow", ...]]:
+        return find_visible_polar_passes(
+            LonLat(lon=14.41854, lat=50.07366),
+            "2023-06-20 9:00",
+            tle_archive=lambda satellite: None,  # type: ignore  # not used by the mocked _get_orbital
+            satellite=satellites,
+            dt=datetime.timedelta(hours=1),
+            horizon=10,
+            num_workers=num_workers,
+        )
+
+    # parallel processing gives the same results as serial processing, in order of the satellites
+    passes = find_passes(num_workers=3)
+    assert list(passes) == satellites
+    assert passes == find_passes(num_workers=None)
+    assert len(set(passes.values())) == len(satellites)
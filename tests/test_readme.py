@@ -1,6 +1,8 @@
 from typing import TYPE_CHECKING
 from pathlib import Path
 
+import pytest
+
 
 if TYPE_CHECKING:
     from downsat.clients.eumdac import EumdacKey
@@ -32,6 +34,7 @@ def test_downloading_data_msg(msg_archive_path: Path, eumdac_key: "EumdacKey") -
     EumdacCollection(name="MSG", credentials=key).collection.search_options
 
 
+@pytest.mark.network
 def test_downloading_data_metop(metop_archive_path: Path) -> None:
     # --- Downloading data to cover certain point of region of interest
     from downsat import Metop
@@ -45,6 +48,7 @@ def test_downloading_data_metop(metop_archive_path: Path) -> None:
     metop["2022110411"]
 
 
+@pytest.mark.network
 def test_downloading_data_satpy(msg_archive_path: Path, is_satpy_available: bool) -> None:  # noqa: U100
     from downsat import MSG
 
@@ -108,7 +112,7 @@ def test_satellite_info() -> None:
     metop_a, metop_b = satellite_info["METOP-A", "METOP-B"]  # type: ignore
 
 
-def test_find_visible_polar_passes(tmp_path: Path, spacetrack_key: "SpaceTrackKey") -> None:
+def test_find_visible_polar_passes(tle_archive_path: Path, spacetrack_key: "SpaceTrackKey") -> None:
     import datetime
     from functools import partial
 
@@ -118,7 +122,7 @@ def test_find_visible_polar_passes(tmp_path: Path, spacetrack_key: "SpaceTrackKe
     prague = LonLat(lon=14.41854, lat=50.07366)
     time = "2023-06-20 9:00"
     dt = datetime.timedelta(hours=1)  # time tolerance +- 1 hour
-    tle_archive = partial(DailyTLE, credentials=spacetrack_key, data_path=tmp_path / "tle")
+    tle_archive = partial(DailyTLE, credentials=spacetrack_key, data_path=tle_archive_path)
 
     metop_a_passes = find_visible_polar_passes(prague, time, tle_archive, satellite="METOP-A", dt=dt)
     assert metop_a_passes[0].datetime == datetime.datetime(